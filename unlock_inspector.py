@@ -32,10 +32,16 @@ import sys
 import ctypes
 import time
 import stat
+import threading
+import re
 from ctypes import wintypes
 from dataclasses import dataclass, field
 from typing import List, Optional, Callable
 from enum import Enum
+from collections import deque
+from functools import lru_cache
+from itertools import islice
+from html import escape, unescape
 
 # High DPI support - must be set before QApplication
 os.environ["QT_ENABLE_HIGHDPI_SCALING"] = "1"
@@ -44,10 +50,13 @@ os.environ["QT_SCALE_FACTOR_ROUNDING_POLICY"] = "PassThrough"
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QScrollArea, QFrame, QProgressBar,
-    QFileDialog, QTabWidget, QTextEdit
+    QFileDialog, QTabWidget, QPlainTextEdit
 )
-from PySide6.QtCore import Qt, QThread, Signal, QTimer, QSize
-from PySide6.QtGui import QFont, QTextCursor, QIcon, QPainter
+from PySide6.QtCore import (
+    Qt, QObject, QThread, Signal, QTimer, QSize, QRunnable, QThreadPool, QMutex, QMutexLocker,
+    QSemaphore
+)
+from PySide6.QtGui import QFont, QTextCursor, QTextBlockFormat, QTextCharFormat, QIcon, QPainter
 from PySide6.QtSvg import QSvgRenderer
 
 
@@ -59,7 +68,9 @@ INFO_ICON_SVG = '''<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24
   <line x1="12" y1="8" x2="12.01" y2="8"/>
 </svg>'''
 
-def create_svg_icon(svg_data: str, color: str, size: int = 18) -> QIcon:
+@lru_cache(maxsize=64)
+def render_svg_pixmap(svg_data: str, color: str, size: int = 18):
+    # Cached: the details dialog shows the same pixmap on every open
     from PySide6.QtGui import QPixmap
     svg_colored = svg_data.format(color=color)
     renderer = QSvgRenderer(svg_colored.encode())
@@ -68,7 +79,12 @@ def create_svg_icon(svg_data: str, color: str, size: int = 18) -> QIcon:
     painter = QPainter(pixmap)
     renderer.render(painter)
     painter.end()
-    return QIcon(pixmap)
+    return pixmap
+
+@lru_cache(maxsize=64)
+def create_svg_icon(svg_data: str, color: str, size: int = 18) -> QIcon:
+    # Cached: every LockedFileCard asks for the same icon
+    return QIcon(render_svg_pixmap(svg_data, color, size))
 
 
 # ============== Theme ==============
@@ -97,9 +113,9 @@ class Colors:
 BTN_WIDTH = 70
 BTN_HEIGHT = 28
 
-def get_btn_style(color: str) -> str:
+def get_btn_style(color: str, selector: str = "QPushButton") -> str:
     return f"""
-        QPushButton {{
+        {selector} {{
             background-color: transparent;
             color: {color};
             font-size: 11px;
@@ -110,18 +126,143 @@ def get_btn_style(color: str) -> str:
             min-width: {BTN_WIDTH}px;
             max-height: {BTN_HEIGHT}px;
         }}
-        QPushButton:hover {{
+        {selector}:hover {{
             background-color: rgba(155, 123, 207, 0.15);
         }}
-        QPushButton:disabled {{
+        {selector}:disabled {{
             color: #555555;
             border-color: #555555;
         }}
     """
 
-BTN_PRIMARY = get_btn_style(Colors.ACCENT)
-BTN_DANGER = get_btn_style(Colors.DANGER)
-BTN_DEFAULT = get_btn_style(Colors.TEXT_DIM)
+
+# ============== Application Style ==============
+
+# Installed once on MainWindow and matched by object name, so pages, cards and
+# dialogs don't each parse their own style sheet. The "*" rule replaces the
+# window's old selector-less background and loses to every #name rule.
+_LABEL = "border: none; background: transparent;"
+
+APP_QSS = f"""
+    * {{ background-color: {Colors.BG}; }}
+    
+    QWidget#overlay {{ background-color: rgba(0, 0, 0, 0.6); }}
+    QFrame#modalDialog, QFrame#modalDialogDanger, QFrame#infoDialog {{
+        background-color: {Colors.BG_CARD};
+        border: 2px solid {Colors.ACCENT};
+        border-radius: 8px;
+    }}
+    QFrame#modalDialogDanger {{ border-color: {Colors.DANGER}; }}
+    QFrame#infoDialog {{ border-radius: 10px; }}
+    QLabel#modalTitle {{ color: {Colors.TEXT}; font-size: 15px; font-weight: bold; {_LABEL} }}
+    QLabel#modalMessage {{ color: {Colors.TEXT_DIM}; font-size: 13px; {_LABEL} }}
+    
+    QWidget#scanResults {{ background-color: {Colors.BG}; border: none; border-radius: 6px; }}
+    QLabel#emptyLabel {{ color: {Colors.TEXT_DIM}; font-size: 13px; }}
+    QLabel#statusLabel {{ color: {Colors.TEXT_DIM}; font-size: 11px; }}
+    QLabel#moreHint {{ color: {Colors.TEXT_DIM}; font-size: 11px; }}
+    QFrame#logTitleBox {{ background-color: {Colors.BG_CARD}; border: none; border-radius: 6px; }}
+    QLabel#logTitle {{ color: {Colors.TEXT}; font-size: 13px; font-weight: bold; {_LABEL} }}
+    QLabel#footer {{ color: {Colors.TEXT_DIM}; font-size: 10px; padding: 8px; }}
+    
+    QFrame#lockedCard {{ background-color: {Colors.BG_CARD}; border: 1px solid {Colors.BORDER}; border-radius: 8px; }}
+    QLabel#cardTitle, QLabel#sectionValue {{ color: {Colors.TEXT}; font-size: 14px; font-weight: bold; {_LABEL} }}
+    QLabel#cardBadge {{
+        background: transparent; color: {Colors.DANGER}; font-size: 11px; font-weight: bold;
+        padding: 2px 8px; border: 1px solid {Colors.DANGER}; border-radius: 10px;
+    }}
+    QLabel#cardProc {{ color: {Colors.TEXT}; font-size: 13px; font-weight: 600; {_LABEL} }}
+    QLabel#cardPid {{ color: {Colors.WARNING}; font-size: 13px; font-weight: bold; {_LABEL} }}
+    QWidget#cardRow {{ background: transparent; }}
+    QPushButton#iconButton {{ background: transparent; border: none; border-radius: 4px; }}
+    QPushButton#iconButton:hover {{ background: rgba(155, 123, 207, 0.2); }}
+    
+    QLabel#infoIcon {{ {_LABEL} }}
+    QLabel#infoTitle {{ color: {Colors.TEXT}; font-size: 16px; font-weight: bold; {_LABEL} }}
+    QPushButton#infoClose {{
+        background: transparent; color: {Colors.TEXT_DIM}; font-size: 18px; font-weight: bold;
+        border: none; border-radius: 4px;
+    }}
+    QPushButton#infoClose:hover {{ background: rgba(255, 255, 255, 0.1); color: {Colors.TEXT}; }}
+    QFrame#section {{ background: {Colors.BG_INPUT}; border: 1px solid {Colors.BORDER}; border-radius: 6px; }}
+    QLabel#sectionLabel {{ color: {Colors.TEXT_DIM}; font-size: 10px; font-weight: bold; {_LABEL} }}
+    QLabel#sectionPath {{ color: {Colors.TEXT_DIM}; font-size: 11px; {_LABEL} }}
+    QLabel#procTitle {{ color: {Colors.ACCENT}; font-size: 10px; font-weight: bold; {_LABEL} }}
+    QLabel#procType {{ color: {Colors.TEXT_DIM}; font-size: 10px; {_LABEL} }}
+    QLabel#pidCaption {{ color: {Colors.TEXT_DIM}; font-size: 12px; {_LABEL} }}
+    QLabel#pidValue {{ color: {Colors.WARNING}; font-size: 14px; font-weight: bold; {_LABEL} }}
+    
+    QWidget#infoContent {{ background-color: {Colors.BG}; border: none; }}
+    QFrame#infoCard, QFrame#infoHeader, QFrame#infoTips {{
+        background: {Colors.BG_CARD}; border: 1px solid {Colors.BORDER}; border-radius: 8px;
+    }}
+    QFrame#infoHeader {{ border-color: {Colors.ACCENT}; }}
+    QFrame#infoTips {{ border-color: {Colors.WARNING}; }}
+    QLabel#infoHeading {{ color: {Colors.ACCENT}; font-size: 18px; font-weight: bold; {_LABEL} }}
+    QLabel#infoSubtitle, QLabel#infoText {{ color: {Colors.TEXT_DIM}; font-size: 12px; {_LABEL} }}
+    QLabel#infoSectionTitle {{ color: {Colors.TEXT}; font-size: 14px; font-weight: bold; {_LABEL} }}
+    QLabel#infoTipsTitle {{ color: {Colors.WARNING}; font-size: 14px; font-weight: bold; {_LABEL} }}
+    QLabel#infoTip {{ color: {Colors.TEXT}; font-size: 12px; {_LABEL} }}
+    QLabel#infoItem {{ font-size: 12px; {_LABEL} }}
+    
+    {get_btn_style(Colors.ACCENT, "QPushButton#btnPrimary")}
+    {get_btn_style(Colors.DANGER, "QPushButton#btnDanger")}
+    {get_btn_style(Colors.TEXT_DIM, "QPushButton#btnDefault")}
+    {get_btn_style(Colors.ACCENT, "QPushButton#btnDefault:checked")}
+"""
+
+
+SCROLLAREA_QSS = f"""
+    QScrollArea {{
+        background-color: {Colors.BG};
+        border: 1px solid {Colors.BORDER};
+        border-radius: 6px;
+    }}
+    QScrollArea > QWidget > QWidget {{
+        background-color: {Colors.BG};
+    }}
+"""
+
+PROGRESS_QSS = f"""
+    QProgressBar {{ background-color: {Colors.BORDER}; border: none; border-radius: 2px; height: 4px; }}
+    QProgressBar::chunk {{ background-color: {Colors.ACCENT}; border-radius: 2px; }}
+"""
+
+# Thin accent scrollbar shared by the log view and the info page
+LOG_SCROLLBAR_QSS = """
+    QScrollBar:vertical {
+        background: transparent;
+        width: 8px;
+        margin: 4px 2px 4px 2px;
+    }
+    QScrollBar::handle:vertical {
+        background: rgba(155, 123, 207, 0.4);
+        border-radius: 4px;
+        min-height: 30px;
+    }
+    QScrollBar::handle:vertical:hover {
+        background: rgba(155, 123, 207, 0.6);
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        height: 0;
+    }
+    QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
+        background: transparent;
+    }
+"""
+
+TEXTEDIT_QSS = f"""
+    QPlainTextEdit {{
+        background-color: #0d0d0d;
+        color: #b0b0b0;
+        font-family: Consolas, 'Courier New', monospace;
+        font-size: 12px;
+        border: 1px solid {Colors.BORDER};
+        border-radius: 6px;
+        padding: 12px;
+        selection-background-color: {Colors.ACCENT};
+    }}
+""" + LOG_SCROLLBAR_QSS
 
 
 # Modal overlay for confirmations
@@ -134,23 +275,15 @@ class ModalOverlay(QWidget):
         self._callback = None
         self._bg = QWidget(self)
         self._bg.setGeometry(self.rect())
-        self._bg.setStyleSheet("background-color: rgba(0, 0, 0, 0.6);")
+        self._bg.setObjectName("overlay")
     
     def show_confirm(self, title: str, message: str, danger: bool, callback):
         self._callback = callback
         self.show()
         self.raise_()
         
-        border_color = Colors.DANGER if danger else Colors.ACCENT
-        
         dialog = QFrame(self)
-        dialog.setStyleSheet(f"""
-            QFrame {{
-                background-color: {Colors.BG_CARD};
-                border: 2px solid {border_color};
-                border-radius: 8px;
-            }}
-        """)
+        dialog.setObjectName("modalDialogDanger" if danger else "modalDialog")
         dialog.setFixedSize(320, 140)
         dialog.move((self.width() - 320) // 2, (self.height() - 140) // 2)
         
@@ -160,12 +293,12 @@ class ModalOverlay(QWidget):
         
         # Title - no border, transparent background
         title_lbl = QLabel(title)
-        title_lbl.setStyleSheet(f"color: {Colors.TEXT}; font-size: 15px; font-weight: bold; border: none; background: transparent;")
+        title_lbl.setObjectName("modalTitle")
         layout.addWidget(title_lbl)
         
         # Message - no border, transparent background, larger text
         msg_lbl = QLabel(message)
-        msg_lbl.setStyleSheet(f"color: {Colors.TEXT_DIM}; font-size: 13px; border: none; background: transparent;")
+        msg_lbl.setObjectName("modalMessage")
         msg_lbl.setWordWrap(True)
         layout.addWidget(msg_lbl)
         
@@ -177,13 +310,13 @@ class ModalOverlay(QWidget):
         btn_layout.addStretch()
         
         cancel_btn = QPushButton("Cancel")
-        cancel_btn.setStyleSheet(BTN_DEFAULT)
+        cancel_btn.setObjectName("btnDefault")
         cancel_btn.setCursor(Qt.PointingHandCursor)
         cancel_btn.clicked.connect(lambda: self._respond(False))
         btn_layout.addWidget(cancel_btn)
         
         confirm_btn = QPushButton("Confirm")
-        confirm_btn.setStyleSheet(BTN_DANGER if danger else BTN_PRIMARY)
+        confirm_btn.setObjectName("btnDanger" if danger else "btnPrimary")
         confirm_btn.setCursor(Qt.PointingHandCursor)
         confirm_btn.clicked.connect(lambda: self._respond(True))
         btn_layout.addWidget(confirm_btn)
@@ -214,75 +347,267 @@ class RM_PROCESS_INFO(ctypes.Structure):
         ("bRestartable", wintypes.BOOL),
     ]
 
-rstrtmgr = ctypes.windll.rstrtmgr
-kernel32 = ctypes.windll.kernel32
+rstrtmgr = ctypes.WinDLL("rstrtmgr")
+kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)  # for ctypes.get_last_error()
 ERROR_MORE_DATA = 234
 
+# Prototypes - avoid default int marshalling and truncated 64-bit handles
+rstrtmgr.RmStartSession.argtypes = [ctypes.POINTER(wintypes.DWORD), wintypes.DWORD, wintypes.LPWSTR]
+rstrtmgr.RmStartSession.restype = wintypes.DWORD
+rstrtmgr.RmRegisterResources.argtypes = [
+    wintypes.DWORD, wintypes.UINT, ctypes.POINTER(wintypes.LPCWSTR),
+    wintypes.UINT, ctypes.c_void_p, wintypes.UINT, ctypes.c_void_p,
+]
+rstrtmgr.RmRegisterResources.restype = wintypes.DWORD
+rstrtmgr.RmGetList.argtypes = [
+    wintypes.DWORD, ctypes.POINTER(wintypes.UINT), ctypes.POINTER(wintypes.UINT),
+    ctypes.POINTER(RM_PROCESS_INFO), ctypes.POINTER(wintypes.DWORD),
+]
+rstrtmgr.RmGetList.restype = wintypes.DWORD
+rstrtmgr.RmEndSession.argtypes = [wintypes.DWORD]
+rstrtmgr.RmEndSession.restype = wintypes.DWORD
+
+kernel32.GetFileAttributesW.argtypes = [wintypes.LPCWSTR]
+kernel32.GetFileAttributesW.restype = wintypes.DWORD
+kernel32.SetFileAttributesW.argtypes = [wintypes.LPCWSTR, wintypes.DWORD]
+kernel32.SetFileAttributesW.restype = wintypes.BOOL
+kernel32.DeleteFileW.argtypes = [wintypes.LPCWSTR]
+kernel32.DeleteFileW.restype = wintypes.BOOL
+kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+kernel32.OpenProcess.restype = wintypes.HANDLE
+kernel32.TerminateProcess.argtypes = [wintypes.HANDLE, wintypes.UINT]
+kernel32.TerminateProcess.restype = wintypes.BOOL
+kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+kernel32.CloseHandle.restype = wintypes.BOOL
+kernel32.FindFirstChangeNotificationW.argtypes = [wintypes.LPCWSTR, wintypes.BOOL, wintypes.DWORD]
+kernel32.FindFirstChangeNotificationW.restype = wintypes.HANDLE
+kernel32.FindNextChangeNotification.argtypes = [wintypes.HANDLE]
+kernel32.FindNextChangeNotification.restype = wintypes.BOOL
+kernel32.FindCloseChangeNotification.argtypes = [wintypes.HANDLE]
+kernel32.FindCloseChangeNotification.restype = wintypes.BOOL
+kernel32.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+kernel32.WaitForSingleObject.restype = wintypes.DWORD
+kernel32.CreateFileW.argtypes = [
+    wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD, ctypes.c_void_p,
+    wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE,
+]
+kernel32.CreateFileW.restype = wintypes.HANDLE
+
+INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+FILE_NOTIFY_CHANGE_FILE_NAME = 0x1
+WAIT_OBJECT_0 = 0
+
 
 # ============== Data Models ==============
 
-@dataclass
+# RM_APP_TYPE values
+_APP_TYPE_NAMES = {0: "Unknown", 1: "App", 2: "App", 3: "Service", 4: "Explorer", 5: "Console", 1000: "Critical"}
+
+@dataclass(slots=True, frozen=True)
 class LockingProcess:
     pid: int
     name: str
     app_type: int
+    type_name: str = field(init=False, repr=False, compare=False)
     
-    @property
-    def type_name(self) -> str:
-        return {0: "Unknown", 1: "App", 2: "App", 3: "Service", 4: "Explorer", 5: "Console", 1000: "Critical"}.get(self.app_type, "Unknown")
+    def __post_init__(self):
+        object.__setattr__(self, "type_name", _APP_TYPE_NAMES.get(self.app_type, "Unknown"))
 
-@dataclass  
+@dataclass(slots=True, frozen=True)
 class LockedFile:
     path: str
-    processes: List[LockingProcess]
+    processes: tuple[LockingProcess, ...]
+    filename: str = field(init=False, repr=False, compare=False)
     
-    @property
-    def filename(self) -> str:
-        return os.path.basename(self.path)
+    def __post_init__(self):
+        # A list here would make the generated __hash__ raise
+        object.__setattr__(self, "processes", tuple(self.processes))
+        object.__setattr__(self, "filename", os.path.basename(self.path))
 
 
 # ============== Restart Manager Service ==============
 
-def get_locking_processes(filepath: str) -> List[LockingProcess]:
-    processes = []
-    if not os.path.exists(filepath):
-        return processes
+def _is_probably_locked(filepath: str) -> bool:
+    """
+    Cheap pre-check before a Restart Manager query.
     
-    filepath = os.path.abspath(filepath)
-    session_handle = wintypes.DWORD()
-    session_key = ctypes.create_unicode_buffer(64)
+    Opening the file for read/write with no sharing only succeeds when no
+    other handle is open on it, in which case nobody can be locking it.
+    """
+    GENERIC_RW = 0xC0000000
+    OPEN_EXISTING = 3
+    handle = kernel32.CreateFileW(filepath, GENERIC_RW, 0, None, OPEN_EXISTING, 0x80, None)
+    if handle == INVALID_HANDLE_VALUE:
+        # Sharing violation, lock violation, or access denied (can't tell - ask RM)
+        return ctypes.get_last_error() in (32, 33, 5)
+    kernel32.CloseHandle(handle)
+    return False
+
+
+def _iter_files(root: str, on_dir: Optional[Callable[[str], None]] = None):
+    """Yield every file path under root using os.scandir's cached entry types."""
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        if on_dir:
+            on_dir(directory)
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file(follow_symlinks=False):
+                            yield entry.path
+                        elif entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+        # Reversed so directories are visited in listing order
+        stack.extend(reversed(subdirs))
+
+
+_proc_info_local = threading.local()
+
+
+def _get_proc_info_buffer(size: int):
+    """Per-thread RM_PROCESS_INFO array, grown by doubling and never shrunk."""
+    buffer = getattr(_proc_info_local, "buffer", None)
+    if buffer is None or len(buffer) < size:
+        capacity = len(buffer) if buffer is not None else RmSessionHandle.PROC_INFO_BUFFER_SIZE
+        while capacity < size:
+            capacity *= 2
+        buffer = (RM_PROCESS_INFO * capacity)()
+        _proc_info_local.buffer = buffer
+    return buffer
+
+
+class RmSessionHandle:
+    """
+    Restart Manager session as a context manager.
     
-    if rstrtmgr.RmStartSession(ctypes.byref(session_handle), 0, session_key) != 0:
-        return processes
+    Resources registered on a session accumulate for its whole lifetime,
+    so one session answers "who locks any of these files". Independent
+    queries need their own session.
+    """
     
-    try:
-        files_array = (wintypes.LPCWSTR * 1)(ctypes.c_wchar_p(filepath))
-        if rstrtmgr.RmRegisterResources(session_handle.value, 1, files_array, 0, None, 0, None) != 0:
-            return processes
-        
+    PROC_INFO_BUFFER_SIZE = 32  # initial RM_PROCESS_INFO slots per thread
+    
+    def __init__(self):
+        self.handle = wintypes.DWORD()
+        self._active = False
+    
+    def __enter__(self) -> "RmSessionHandle":
+        session_key = ctypes.create_unicode_buffer(64)
+        self._active = rstrtmgr.RmStartSession(ctypes.byref(self.handle), 0, session_key) == 0
+        return self
+    
+    def __exit__(self, *exc):
+        if self._active:
+            rstrtmgr.RmEndSession(self.handle.value)
+            self._active = False
+    
+    def register(self, paths: List[str]) -> bool:
+        if not self._active or not paths:
+            return False
+        files_array = (wintypes.LPCWSTR * len(paths))(*paths)
+        return rstrtmgr.RmRegisterResources(self.handle.value, len(paths), files_array, 0, None, 0, None) == 0
+    
+    def get_list(self) -> List[LockingProcess]:
+        """Processes locking any of the registered resources."""
+        # Big enough for nearly every file, so RmGetList is usually called once
+        proc_info_array = _get_proc_info_buffer(self.PROC_INFO_BUFFER_SIZE)
         proc_info_needed = wintypes.UINT(0)
-        proc_info = wintypes.UINT(0)
+        proc_info = wintypes.UINT(len(proc_info_array))
         reboot_reasons = wintypes.DWORD(0)
         
-        result = rstrtmgr.RmGetList(session_handle.value, ctypes.byref(proc_info_needed),
-                                     ctypes.byref(proc_info), None, ctypes.byref(reboot_reasons))
+        result = rstrtmgr.RmGetList(self.handle.value, ctypes.byref(proc_info_needed),
+                                     ctypes.byref(proc_info), proc_info_array, ctypes.byref(reboot_reasons))
         
         if result == ERROR_MORE_DATA and proc_info_needed.value > 0:
-            proc_info_array = (RM_PROCESS_INFO * proc_info_needed.value)()
-            proc_info.value = proc_info_needed.value
-            
-            if rstrtmgr.RmGetList(session_handle.value, ctypes.byref(proc_info_needed),
-                                   ctypes.byref(proc_info), proc_info_array, ctypes.byref(reboot_reasons)) == 0:
-                for i in range(proc_info.value):
-                    info = proc_info_array[i]
-                    processes.append(LockingProcess(pid=info.Process.dwProcessId, name=info.strAppName, app_type=info.ApplicationType))
-    finally:
-        rstrtmgr.RmEndSession(session_handle.value)
+            proc_info_array = _get_proc_info_buffer(proc_info_needed.value)
+            proc_info.value = len(proc_info_array)
+            result = rstrtmgr.RmGetList(self.handle.value, ctypes.byref(proc_info_needed),
+                                         ctypes.byref(proc_info), proc_info_array, ctypes.byref(reboot_reasons))
+        
+        if result != 0:
+            return []
+        return [LockingProcess(pid=info.Process.dwProcessId, name=info.strAppName, app_type=info.ApplicationType)
+                for info in proc_info_array[:proc_info.value]]
+    
+    def query(self, filepath: str) -> List[LockingProcess]:
+        return self.get_list() if self.register([filepath]) else []
+
+
+def get_locking_processes(filepath: str, check_exists: bool = True) -> List[LockingProcess]:
+    if check_exists and not os.path.exists(filepath):
+        return []
     
-    return processes
+    with RmSessionHandle() as session:
+        return session.query(os.path.abspath(filepath))
+
+
+def get_locking_processes_batch(filepaths: List[str], check_exists: bool = True) -> dict[str, List[LockingProcess]]:
+    """
+    Query many files with a single Restart Manager session.
+    
+    RmGetList only reports the union of lockers for all registered files,
+    so files are re-queried one by one only when that union is non-empty.
+    Returns a mapping of locked file path -> locking processes.
+    """
+    paths = [p for p in filepaths if os.path.exists(p)] if check_exists else list(filepaths)
+    if not paths:
+        return {}
+    
+    with RmSessionHandle() as session:
+        if not session.register([os.path.abspath(p) for p in paths]):
+            return {}
+        union = session.get_list()
+    
+    if not union:
+        return {}
+    # A lone file's lockers are the union itself - no second session needed
+    if len(paths) == 1:
+        return {paths[0]: union}
+    
+    # Someone holds at least one of these files - find out which ones
+    locked = {}
+    for path in paths:
+        processes = get_locking_processes(path, check_exists=False)
+        if processes:
+            locked[path] = processes
+    return locked
+
+
+KILL_CACHE_TTL = 2.0  # seconds a killed PID is remembered
+_recently_killed: dict[int, float] = {}
+_recently_killed_lock = threading.Lock()  # written by delete workers and the GUI thread
+
+
+def killed_recently(pid: int, min_age: float = 0.0) -> bool:
+    """True if pid was killed within the TTL, and at least min_age seconds ago."""
+    killed_at = _recently_killed.get(pid)
+    return killed_at is not None and min_age <= time.monotonic() - killed_at < KILL_CACHE_TTL
 
 
 def kill_process(pid: int, force: bool = False) -> tuple[bool, str]:
+    # The same process often holds many files - don't kill it once per file
+    if killed_recently(pid):
+        return True, "Already ended (cached)"
+    
+    ok, msg = _terminate_process(pid, force)
+    if ok:
+        now = time.monotonic()
+        with _recently_killed_lock:
+            for old_pid, killed_at in list(_recently_killed.items()):
+                if now - killed_at >= KILL_CACHE_TTL:
+                    _recently_killed.pop(old_pid, None)
+            _recently_killed[pid] = now
+    return ok, msg
+
+
+def _terminate_process(pid: int, force: bool) -> tuple[bool, str]:
     try:
         if force:
             handle = kernel32.OpenProcess(0x0001, False, pid)
@@ -347,16 +672,44 @@ class SmartFileDeleter:
     """
     
     MAX_ATTEMPTS = 3
-    RETRY_DELAY = 0.5  # seconds
+    RETRY_DELAYS = (0.05, 0.15)  # seconds, backoff between attempts (MAX_ATTEMPTS - 1 waits)
     PROCESS_KILL_WAIT = 0.3  # wait after killing process
+    VERIFY_TIMEOUT_MS = 50  # max wait for the directory change after a delete
+    # Covered by force_delete_api on retries: it resets the attributes itself
+    # and DeleteFileW is what os.remove calls anyway
+    FIRST_ATTEMPT_ONLY = ("direct_delete", "remove_readonly", "fix_permissions")
     
     def __init__(self, log_callback: Optional[Callable] = None):
         self.log_callback = log_callback
+        self._attr_cache: dict[str, int] = {}
     
     def _log(self, message: str, level: str = "info"):
         if self.log_callback:
             self.log_callback(message, level)
     
+    def _get_attrs(self, filepath: str) -> int:
+        """GetFileAttributesW, cached until we change the file ourselves."""
+        attrs = self._attr_cache.get(filepath)
+        if attrs is None:
+            attrs = kernel32.GetFileAttributesW(filepath)
+            self._attr_cache[filepath] = attrs
+        return attrs
+    
+    def _set_attrs(self, filepath: str, attrs: int):
+        kernel32.SetFileAttributesW(filepath, attrs)
+        self._attr_cache.pop(filepath, None)
+    
+    def _verify_deleted(self, filepath: str, change_handle) -> bool:
+        """Check the file is gone, waiting on the parent directory change if needed."""
+        if not os.path.exists(filepath):
+            return True
+        if change_handle:
+            if kernel32.WaitForSingleObject(change_handle, self.VERIFY_TIMEOUT_MS) == WAIT_OBJECT_0:
+                kernel32.FindNextChangeNotification(change_handle)
+        else:
+            time.sleep(self.VERIFY_TIMEOUT_MS / 1000)
+        return not os.path.exists(filepath)
+    
     def delete_file(self, filepath: str, kill_processes: bool = True) -> DeleteResult:
         """Attempt to delete a file using multiple strategies."""
         result = DeleteResult(success=False, file_path=filepath)
@@ -376,6 +729,8 @@ class SmartFileDeleter:
             
             if processes:
                 self._log(f"Found {len(processes)} locking process(es)", "warn")
+                # Another delete already killed these and its wait has run out
+                already_waited = all(killed_recently(p.pid, self.PROCESS_KILL_WAIT) for p in processes)
                 for proc in processes:
                     # Try graceful close first, then force kill
                     ok, msg = kill_process(proc.pid, force=False)
@@ -389,7 +744,8 @@ class SmartFileDeleter:
                         self._log(f"Failed to kill {proc.name}: {msg}", "warn")
                 
                 # Wait for handles to be released
-                time.sleep(self.PROCESS_KILL_WAIT)
+                if not already_waited:
+                    time.sleep(self.PROCESS_KILL_WAIT)
                 
                 # Check if processes respawned
                 new_procs = get_locking_processes(filepath)
@@ -410,10 +766,30 @@ class SmartFileDeleter:
             ("rename_and_delete", self._try_rename_delete),
         ]
         
+        # Wake up on file name changes in the parent instead of sleeping blindly
+        parent_dir = os.path.dirname(os.path.abspath(filepath))
+        change_handle = kernel32.FindFirstChangeNotificationW(parent_dir, False, FILE_NOTIFY_CHANGE_FILE_NAME)
+        if change_handle == INVALID_HANDLE_VALUE:
+            change_handle = None
+        try:
+            return self._run_strategies(filepath, strategies, result, kill_processes, change_handle)
+        finally:
+            if change_handle:
+                kernel32.FindCloseChangeNotification(change_handle)
+    
+    def _run_strategies(self, filepath: str, strategies: list, result: DeleteResult,
+                        kill_processes: bool, change_handle) -> DeleteResult:
+        """Retry loop over the deletion strategies."""
+        # Drop anything cached by an earlier delete of this path; read lazily from here on
+        self._attr_cache.pop(filepath, None)
+        
         # Try each strategy with retries
         for attempt in range(1, self.MAX_ATTEMPTS + 1):
             self._log(f"=== Deletion Attempt {attempt}/{self.MAX_ATTEMPTS} ===", "info")
             
+            if attempt > 1:
+                strategies = [(n, f) for n, f in strategies if n not in self.FIRST_ATTEMPT_ONLY]
+            
             for strategy_name, strategy_func in strategies:
                 try:
                     success, error = strategy_func(filepath)
@@ -421,8 +797,7 @@ class SmartFileDeleter:
                     
                     if success:
                         # Verify file is actually deleted
-                        time.sleep(0.1)
-                        if not os.path.exists(filepath):
+                        if self._verify_deleted(filepath, change_handle):
                             result.success = True
                             result.file_still_exists = False
                             self._log(f"Success with strategy: {strategy_name}", "success")
@@ -440,8 +815,9 @@ class SmartFileDeleter:
             
             # Wait before next attempt
             if attempt < self.MAX_ATTEMPTS:
-                self._log(f"Waiting {self.RETRY_DELAY}s before next attempt...", "info")
-                time.sleep(self.RETRY_DELAY)
+                delay = self.RETRY_DELAYS[min(attempt - 1, len(self.RETRY_DELAYS) - 1)]
+                self._log(f"Waiting {delay}s before next attempt...", "info")
+                time.sleep(delay)
                 
                 # Re-check for new locking processes
                 if kill_processes:
@@ -485,7 +861,7 @@ class SmartFileDeleter:
         
         # Check if system file
         try:
-            attrs = kernel32.GetFileAttributesW(filepath)
+            attrs = self._get_attrs(filepath)
             if attrs != 0xFFFFFFFF:
                 if attrs & 0x4:  # FILE_ATTRIBUTE_SYSTEM
                     reasons.append("System file")
@@ -510,14 +886,14 @@ class SmartFileDeleter:
         """Remove read-only attribute before deletion."""
         try:
             # Get current attributes
-            attrs = kernel32.GetFileAttributesW(filepath)
+            attrs = self._get_attrs(filepath)
             if attrs == 0xFFFFFFFF:
                 return False, "Cannot get file attributes"
             
             # Remove read-only if set
             if attrs & 0x1:  # FILE_ATTRIBUTE_READONLY
                 new_attrs = attrs & ~0x1
-                kernel32.SetFileAttributesW(filepath, new_attrs)
+                self._set_attrs(filepath, new_attrs)
                 self._log("Removed read-only attribute", "info")
             
             os.remove(filepath)
@@ -529,6 +905,7 @@ class SmartFileDeleter:
         """Fix permissions using chmod before deletion."""
         try:
             # Grant full permissions
+            self._attr_cache.pop(filepath, None)  # chmod toggles the read-only attribute
             os.chmod(filepath, stat.S_IWUSR | stat.S_IRUSR | stat.S_IXUSR)
             os.remove(filepath)
             return True, None
@@ -541,7 +918,7 @@ class SmartFileDeleter:
         """Force delete using Windows kernel32 API."""
         try:
             # Set normal attributes first
-            kernel32.SetFileAttributesW(filepath, 0x80)  # FILE_ATTRIBUTE_NORMAL
+            self._set_attrs(filepath, 0x80)  # FILE_ATTRIBUTE_NORMAL
             
             # Try DeleteFileW
             result = kernel32.DeleteFileW(filepath)
@@ -567,6 +944,7 @@ class SmartFileDeleter:
             temp_name = filepath + f".{uuid.uuid4().hex[:8]}.tmp"
             
             # Try to rename
+            self._attr_cache.pop(filepath, None)
             os.rename(filepath, temp_name)
             self._log(f"Renamed to temp file", "info")
             
@@ -593,47 +971,153 @@ class SmartFileDeleter:
         return success, msg
 
 
+# ============== Delete Worker ==============
+
+class DeleteSignals(QObject):
+    finished = Signal(object)  # DeleteResult
+    log = Signal(str, str)  # message, level
+
+
+class DeleterWorker(QRunnable):
+    """Runs SmartFileDeleter.delete_file on a pool thread."""
+    
+    def __init__(self, filepath: str, kill_processes: bool = True):
+        super().__init__()
+        self.filepath = filepath
+        self.kill_processes = kill_processes
+        self.signals = DeleteSignals()
+    
+    def run(self):
+        deleter = SmartFileDeleter(self.signals.log.emit)
+        try:
+            result = deleter.delete_file(self.filepath, kill_processes=self.kill_processes)
+        except Exception as e:
+            result = DeleteResult(success=False, file_path=self.filepath, final_error=str(e))
+        self.signals.finished.emit(result)
+
+
 # ============== Scanner Thread ==============
 
+class ScanBatchWorker(QRunnable):
+    """Runs one batch of Restart Manager queries on a pool thread."""
+    
+    def __init__(self, scanner: "ScannerThread", batch: List[str]):
+        super().__init__()
+        self.scanner = scanner
+        self.batch = batch
+    
+    def run(self):
+        try:
+            self.scanner._scan_batch(self.batch)
+        finally:
+            self.scanner._in_flight.release()
+
+
 class ScannerThread(QThread):
-    progress = Signal(int, int, str)
-    file_found = Signal(object)
+    progress = Signal(int, int, str)  # scanned, total (-1 while still enumerating), path
+    files_found = Signal(list)
     finished_scan = Signal(int, int)
     log_message = Signal(str)
     
+    BATCH_SIZE = 128  # files registered per Restart Manager session
+    MAX_WORKERS = min(8, os.cpu_count() or 1)  # RM queries mostly wait on RPC
+    FLUSH_INTERVAL = 0.1  # seconds between files_found emissions
+    
     def __init__(self, path: str):
         super().__init__()
         self.path = path
         self._stop = False
+        self._mutex = QMutex()
+        # Bounds queued batches so enumeration can't run far ahead of the workers
+        self._in_flight = QSemaphore(self.MAX_WORKERS * 2)
+        self._total = -1
+        self._scanned = 0
+        self._locked_count = 0
+        self._pending_hits: List[LockedFile] = []
+        self._last_flush = 0.0
     
     def stop(self):
         self._stop = True
     
     def run(self):
-        files = [self.path] if os.path.isfile(self.path) else []
+        dir_count = 0
+        
+        def count_dir(_path: str):
+            nonlocal dir_count
+            dir_count += 1
+        
         if os.path.isdir(self.path):
-            for root, dirs, filenames in os.walk(self.path):
-                self.log_message.emit(f"Scanning directory: {root}")
-                for f in filenames:
-                    files.append(os.path.join(root, f))
+            files = _iter_files(self.path, count_dir)
+        else:
+            files = [self.path] if os.path.isfile(self.path) else []
         
-        total, locked_count = len(files), 0
-        self.log_message.emit(f"Total files to scan: {total}")
+        pool = QThreadPool()
+        pool.setMaxThreadCount(self.MAX_WORKERS)
         
-        for i, filepath in enumerate(files):
+        # Enumerate and scan at the same time - batches go out as soon as they fill
+        count = 0
+        batch = []
+        for filepath in files:
             if self._stop:
-                self.log_message.emit("Scan stopped by user")
                 break
-            self.progress.emit(i + 1, total, filepath)
-            try:
-                processes = get_locking_processes(filepath)
-                if processes:
-                    self.file_found.emit(LockedFile(path=filepath, processes=processes))
-                    locked_count += 1
-            except Exception as e:
-                self.log_message.emit(f"Error scanning {filepath}: {e}")
-        
-        self.finished_scan.emit(total if not self._stop else i + 1, locked_count)
+            batch.append(filepath)
+            count += 1
+            if len(batch) == self.BATCH_SIZE:
+                self._submit(pool, batch)
+                batch = []
+        if batch and not self._stop:
+            self._submit(pool, batch)
+        
+        self._total = count
+        # One summary line instead of a signal per directory; a stopped walk has no totals
+        if not self._stop:
+            found = f"Found {count} file{'' if count == 1 else 's'}"
+            if dir_count:
+                found += f" in {dir_count} director{'y' if dir_count == 1 else 'ies'} under {self.path}"
+            self.log_message.emit(found)
+        
+        pool.waitForDone()
+        self._flush_hits()
+        
+        if self._stop:
+            self.log_message.emit("Scan stopped by user")
+        self.finished_scan.emit(self._scanned, self._locked_count)
+    
+    def _submit(self, pool: QThreadPool, batch: List[str]):
+        self._in_flight.acquire()
+        pool.start(ScanBatchWorker(self, batch))
+    
+    def _scan_batch(self, batch: List[str]):
+        """Query one batch; called from pool threads."""
+        if self._stop:
+            return
+        hits = []
+        try:
+            # Only files someone has open are worth a Restart Manager session
+            suspects = [fp for fp in batch if _is_probably_locked(fp)]
+            # Paths come straight from the directory listing, no need to re-stat
+            locked = get_locking_processes_batch(suspects, check_exists=False) if suspects else {}
+            hits = [LockedFile(path=fp, processes=locked[fp]) for fp in batch if fp in locked]
+        except Exception as e:
+            self.log_message.emit(f"Error scanning {batch[0]}..{batch[-1]}: {e}")
+        
+        with QMutexLocker(self._mutex):
+            self._scanned += len(batch)
+            self._locked_count += len(hits)
+            self._pending_hits.extend(hits)
+            scanned = self._scanned
+            due = time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL
+        self.progress.emit(scanned, self._total, batch[-1])
+        if due:
+            self._flush_hits()
+    
+    def _flush_hits(self):
+        """Hand buffered results to the GUI in one signal."""
+        with QMutexLocker(self._mutex):
+            hits, self._pending_hits = self._pending_hits, []
+            self._last_flush = time.monotonic()
+        if hits:
+            self.files_found.emit(hits)
 
 
 # ============== UI Components ==============
@@ -700,28 +1184,28 @@ class LockedFileCard(QFrame):
     process_close = Signal(int, bool, str)
     auto_delete = Signal(str)
     
-    def __init__(self, locked_file: LockedFile):
+    def __init__(self, locked_file: Optional[LockedFile] = None):
         super().__init__()
         self.locked_file = locked_file
-        self.setStyleSheet(f"QFrame {{ background-color: {Colors.BG_CARD}; border: 1px solid {Colors.BORDER}; border-radius: 8px; }}")
+        self.setObjectName("lockedCard")
+        self._rows = []  # (row, proc_label, pid_label), reused across bind()
         
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(12, 12, 12, 12)
-        layout.setSpacing(10)
+        self._layout = QVBoxLayout(self)
+        self._layout.setContentsMargins(12, 12, 12, 12)
+        self._layout.setSpacing(10)
         
         # Header row - filename, lock badge, and info button
         header = QHBoxLayout()
         header.setSpacing(10)
         
-        filename = QLabel(locked_file.filename)
-        filename.setStyleSheet(f"color: {Colors.TEXT}; font-size: 14px; font-weight: bold; border: none; background: transparent;")
-        filename.setToolTip(locked_file.path)
-        header.addWidget(filename)
+        self._filename = QLabel()
+        self._filename.setObjectName("cardTitle")
+        header.addWidget(self._filename)
         
-        badge = QLabel(f"{len(locked_file.processes)} lock{'s' if len(locked_file.processes) > 1 else ''}")
-        badge.setStyleSheet(f"background: transparent; color: {Colors.DANGER}; font-size: 11px; font-weight: bold; padding: 2px 8px; border: 1px solid {Colors.DANGER}; border-radius: 10px;")
-        badge.setAlignment(Qt.AlignCenter)
-        header.addWidget(badge)
+        self._badge = QLabel()
+        self._badge.setObjectName("cardBadge")
+        self._badge.setAlignment(Qt.AlignCenter)
+        header.addWidget(self._badge)
         
         header.addStretch()
         
@@ -731,63 +1215,85 @@ class LockedFileCard(QFrame):
         info_btn.setIconSize(QSize(16, 16))
         info_btn.setFixedSize(24, 24)
         info_btn.setCursor(Qt.PointingHandCursor)
-        info_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: transparent;
-                border: none;
-                border-radius: 4px;
-            }}
-            QPushButton:hover {{
-                background: rgba(155, 123, 207, 0.2);
-            }}
-        """)
+        info_btn.setObjectName("iconButton")
         info_btn.setToolTip("View details")
         info_btn.clicked.connect(lambda: self._show_info())
         header.addWidget(info_btn)
         
-        layout.addLayout(header)
+        self._layout.addLayout(header)
         
-        # Process rows
-        for proc in locked_file.processes:
-            row = QHBoxLayout()
-            row.setSpacing(8)
-            
+        if locked_file is not None:
+            self.bind(locked_file)
+    
+    def bind(self, locked_file: LockedFile):
+        """Point the card at another locked file, reusing its widgets."""
+        self.locked_file = locked_file
+        procs = locked_file.processes
+        
+        self._filename.setText(locked_file.filename)
+        self._filename.setToolTip(locked_file.path)
+        self._badge.setText(f"{len(procs)} lock{'s' if len(procs) > 1 else ''}")
+        
+        while len(self._rows) < len(procs):
+            self._rows.append(self._add_row(len(self._rows)))
+        
+        for i, (row, proc_label, pid_label) in enumerate(self._rows):
+            if i >= len(procs):
+                row.hide()
+                continue
+            proc = procs[i]
             # Process name - truncate if too long
-            proc_label = QLabel(proc.name[:20] + "..." if len(proc.name) > 20 else proc.name)
-            proc_label.setStyleSheet(f"color: {Colors.TEXT}; font-size: 13px; font-weight: 600; border: none; background: transparent;")
+            proc_label.setText(proc.name[:20] + "..." if len(proc.name) > 20 else proc.name)
             proc_label.setToolTip(proc.name)
-            row.addWidget(proc_label)
-            
-            # PID - prominent
-            pid_label = QLabel(f"PID: {proc.pid}")
-            pid_label.setStyleSheet(f"color: {Colors.WARNING}; font-size: 13px; font-weight: bold; border: none; background: transparent;")
-            row.addWidget(pid_label)
-            
-            row.addStretch()
-            
-            # Compact action buttons
-            close_btn = QPushButton("Close")
-            close_btn.setStyleSheet(BTN_PRIMARY)
-            close_btn.setFixedWidth(60)
-            close_btn.setCursor(Qt.PointingHandCursor)
-            close_btn.clicked.connect(lambda _, p=proc.pid, fp=locked_file.path: self.process_close.emit(p, False, fp))
-            row.addWidget(close_btn)
-            
-            force_btn = QPushButton("Force")
-            force_btn.setStyleSheet(BTN_PRIMARY)
-            force_btn.setFixedWidth(60)
-            force_btn.setCursor(Qt.PointingHandCursor)
-            force_btn.clicked.connect(lambda _, p=proc.pid, fp=locked_file.path: self.process_close.emit(p, True, fp))
-            row.addWidget(force_btn)
-            
-            auto_btn = QPushButton("Delete")
-            auto_btn.setStyleSheet(BTN_DANGER)
-            auto_btn.setFixedWidth(60)
-            auto_btn.setCursor(Qt.PointingHandCursor)
-            auto_btn.clicked.connect(lambda: self.auto_delete.emit(locked_file.path))
-            row.addWidget(auto_btn)
-            
-            layout.addLayout(row)
+            pid_label.setText(f"PID: {proc.pid}")
+            row.show()
+    
+    def _add_row(self, index: int):
+        row = QWidget()
+        row.setObjectName("cardRow")
+        row_layout = QHBoxLayout(row)
+        row_layout.setContentsMargins(0, 0, 0, 0)
+        row_layout.setSpacing(8)
+        
+        proc_label = QLabel()
+        proc_label.setObjectName("cardProc")
+        row_layout.addWidget(proc_label)
+        
+        # PID - prominent
+        pid_label = QLabel()
+        pid_label.setObjectName("cardPid")
+        row_layout.addWidget(pid_label)
+        
+        row_layout.addStretch()
+        
+        # Compact action buttons
+        close_btn = QPushButton("Close")
+        close_btn.setObjectName("btnPrimary")
+        close_btn.setFixedWidth(60)
+        close_btn.setCursor(Qt.PointingHandCursor)
+        close_btn.clicked.connect(lambda: self._emit_close(index, False))
+        row_layout.addWidget(close_btn)
+        
+        force_btn = QPushButton("Force")
+        force_btn.setObjectName("btnPrimary")
+        force_btn.setFixedWidth(60)
+        force_btn.setCursor(Qt.PointingHandCursor)
+        force_btn.clicked.connect(lambda: self._emit_close(index, True))
+        row_layout.addWidget(force_btn)
+        
+        auto_btn = QPushButton("Delete")
+        auto_btn.setObjectName("btnDanger")
+        auto_btn.setFixedWidth(60)
+        auto_btn.setCursor(Qt.PointingHandCursor)
+        auto_btn.clicked.connect(lambda: self.auto_delete.emit(self.locked_file.path))
+        row_layout.addWidget(auto_btn)
+        
+        self._layout.addWidget(row)
+        return row, proc_label, pid_label
+    
+    def _emit_close(self, index: int, force: bool):
+        proc = self.locked_file.processes[index]
+        self.process_close.emit(proc.pid, force, self.locked_file.path)
     
     def _show_info(self):
         """Show detailed info panel"""
@@ -806,18 +1312,12 @@ class InfoPanel(QWidget):
         # Background overlay
         self._bg = QWidget(self)
         self._bg.setGeometry(self.rect())
-        self._bg.setStyleSheet("background-color: rgba(0, 0, 0, 0.6);")
+        self._bg.setObjectName("overlay")
         self._bg.mousePressEvent = lambda e: self.close()
         
         # Dialog panel
         dialog = QFrame(self)
-        dialog.setStyleSheet(f"""
-            QFrame {{
-                background-color: {Colors.BG_CARD};
-                border: 2px solid {Colors.ACCENT};
-                border-radius: 10px;
-            }}
-        """)
+        dialog.setObjectName("infoDialog")
         dialog.setFixedSize(360, 280)
         dialog.move((self.width() - 360) // 2, (self.height() - 280) // 2)
         
@@ -830,13 +1330,13 @@ class InfoPanel(QWidget):
         header.setSpacing(10)
         
         icon_btn = QLabel()
-        icon_btn.setPixmap(create_svg_icon(INFO_ICON_SVG, Colors.ACCENT, 22).pixmap(22, 22))
+        icon_btn.setPixmap(render_svg_pixmap(INFO_ICON_SVG, Colors.ACCENT, 22))
         icon_btn.setFixedSize(22, 22)
-        icon_btn.setStyleSheet("border: none; background: transparent;")
+        icon_btn.setObjectName("infoIcon")
         header.addWidget(icon_btn)
         
         title = QLabel("File Lock Details")
-        title.setStyleSheet(f"color: {Colors.TEXT}; font-size: 16px; font-weight: bold; border: none; background: transparent;")
+        title.setObjectName("infoTitle")
         header.addWidget(title)
         header.addStretch()
         
@@ -844,20 +1344,7 @@ class InfoPanel(QWidget):
         close_btn = QPushButton("×")
         close_btn.setFixedSize(24, 24)
         close_btn.setCursor(Qt.PointingHandCursor)
-        close_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: transparent;
-                color: {Colors.TEXT_DIM};
-                font-size: 18px;
-                font-weight: bold;
-                border: none;
-                border-radius: 4px;
-            }}
-            QPushButton:hover {{
-                background: rgba(255, 255, 255, 0.1);
-                color: {Colors.TEXT};
-            }}
-        """)
+        close_btn.setObjectName("infoClose")
         close_btn.clicked.connect(self.close)
         header.addWidget(close_btn)
         
@@ -865,21 +1352,21 @@ class InfoPanel(QWidget):
         
         # File info
         file_section = QFrame()
-        file_section.setStyleSheet(f"background: {Colors.BG_INPUT}; border: 1px solid {Colors.BORDER}; border-radius: 6px;")
+        file_section.setObjectName("section")
         file_layout = QVBoxLayout(file_section)
         file_layout.setContentsMargins(12, 10, 12, 10)
         file_layout.setSpacing(6)
         
         file_label = QLabel("FILE")
-        file_label.setStyleSheet(f"color: {Colors.TEXT_DIM}; font-size: 10px; font-weight: bold; border: none; background: transparent;")
+        file_label.setObjectName("sectionLabel")
         file_layout.addWidget(file_label)
         
         file_name = QLabel(locked_file.filename)
-        file_name.setStyleSheet(f"color: {Colors.TEXT}; font-size: 14px; font-weight: bold; border: none; background: transparent;")
+        file_name.setObjectName("sectionValue")
         file_layout.addWidget(file_name)
         
         file_path = QLabel(locked_file.path)
-        file_path.setStyleSheet(f"color: {Colors.TEXT_DIM}; font-size: 11px; border: none; background: transparent;")
+        file_path.setObjectName("sectionPath")
         file_path.setWordWrap(True)
         file_layout.addWidget(file_path)
         
@@ -888,7 +1375,7 @@ class InfoPanel(QWidget):
         # Process info
         for i, proc in enumerate(locked_file.processes):
             proc_section = QFrame()
-            proc_section.setStyleSheet(f"background: {Colors.BG_INPUT}; border: 1px solid {Colors.BORDER}; border-radius: 6px;")
+            proc_section.setObjectName("section")
             proc_layout = QVBoxLayout(proc_section)
             proc_layout.setContentsMargins(12, 10, 12, 10)
             proc_layout.setSpacing(4)
@@ -898,29 +1385,29 @@ class InfoPanel(QWidget):
             proc_header.setSpacing(10)
             
             proc_title = QLabel(f"PROCESS {i+1}")
-            proc_title.setStyleSheet(f"color: {Colors.ACCENT}; font-size: 10px; font-weight: bold; border: none; background: transparent;")
+            proc_title.setObjectName("procTitle")
             proc_header.addWidget(proc_title)
             
             proc_type = QLabel(f"[{proc.type_name}]")
-            proc_type.setStyleSheet(f"color: {Colors.TEXT_DIM}; font-size: 10px; border: none; background: transparent;")
+            proc_type.setObjectName("procType")
             proc_header.addWidget(proc_type)
             proc_header.addStretch()
             proc_layout.addLayout(proc_header)
             
             # Process name
             proc_name = QLabel(proc.name)
-            proc_name.setStyleSheet(f"color: {Colors.TEXT}; font-size: 14px; font-weight: bold; border: none; background: transparent;")
+            proc_name.setObjectName("sectionValue")
             proc_name.setWordWrap(True)
             proc_layout.addWidget(proc_name)
             
             # PID
             pid_row = QHBoxLayout()
             pid_label = QLabel("PID:")
-            pid_label.setStyleSheet(f"color: {Colors.TEXT_DIM}; font-size: 12px; border: none; background: transparent;")
+            pid_label.setObjectName("pidCaption")
             pid_row.addWidget(pid_label)
             
             pid_value = QLabel(str(proc.pid))
-            pid_value.setStyleSheet(f"color: {Colors.WARNING}; font-size: 14px; font-weight: bold; border: none; background: transparent;")
+            pid_value.setObjectName("pidValue")
             pid_row.addWidget(pid_value)
             pid_row.addStretch()
             proc_layout.addLayout(pid_row)
@@ -932,15 +1419,35 @@ class InfoPanel(QWidget):
 
 # ============== Scanner Page ==============
 
+_TS_FMT = "%Y-%m-%d %H:%M:%S"        # scan info, actions and report
+_FILE_TS_FMT = "%Y%m%d_%H%M%S"      # default export file name
+
+# Report dividers and section banners
+_H1 = "=" * 70 + "\n"
+_H2 = "-" * 40 + "\n"
+_H1_TITLE = _H1 + "                    UNLOCK INSPECTOR - SCAN REPORT\n" + _H1 + "\n"
+_H1_FILES = _H1 + "                         LOCKED FILES DETAILS\n" + _H1 + "\n"
+_H1_NO_FILES = _H1 + "                         NO LOCKED FILES\n" + _H1
+_H1_ACTIONS = _H1 + "                         ACTIONS PERFORMED\n" + _H1 + "\n"
+_H1_STATS = _H1 + "                            STATISTICS\n" + _H1 + "\n"
+_H1_END = _H1 + "                          END OF REPORT\n" + _H1
+
+
 class ScannerPage(QWidget):
     toast_signal = Signal(str, str)
     log_signal = None
     
+    CARD_PAGE_SIZE = 50     # cards built up front; more are added on scroll
+    CARD_POOL_SIZE = 50     # cleared cards kept around for the next scan
+    ADD_FLUSH_MS = 50       # coalesce incoming locked files for this long
+    ADD_FLUSH_COUNT = 32    # ...or until this many are waiting
+    PROGRESS_UI_INTERVAL = 1 / 30  # cap progress repaints at ~30 Hz
+    USE_NATIVE_DIALOGS = True  # False: Qt's own file dialogs, faster on slow shells
+    
     def __init__(self):
         super().__init__()
         self.current_path = ""
         self.scanner: Optional[ScannerThread] = None
-        self.locked_files: List[LockedFile] = []
         
         # Scan tracking for export
         self.has_scanned = False
@@ -953,6 +1460,26 @@ class ScannerPage(QWidget):
             "actions": []  # Track user actions (close, kill, delete)
         }
         self._scan_start_time = None
+        self._deleting: set[str] = set()  # files with a DeleterWorker running
+        self._cards_shown = 0  # the first _cards_shown entries of _lf_by_path have a card
+        self._card_limit = self.CARD_PAGE_SIZE
+        self._pending: List[LockedFile] = []  # found, not yet added to the page
+        # Every locked file on the page, in the order found; O(1) removal by path
+        self._lf_by_path: dict[str, LockedFile] = {}
+        self._card_by_path: dict[str, LockedFileCard] = {}
+        self._card_pool: List[LockedFileCard] = []
+        self._last_ui_tick = 0.0
+        self._last_percent = -1
+        self._last_browse_dir = os.path.expanduser("~")
+        self._last_export_dir = self._last_browse_dir
+        # Shared by the Browse and Export dialogs
+        self._dialog_options = (QFileDialog.Option(0) if self.USE_NATIVE_DIALOGS
+                                else QFileDialog.DontUseNativeDialog)
+        
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.ADD_FLUSH_MS)
+        self._flush_timer.timeout.connect(self._flush_pending)
         
         self._setup_ui()
     
@@ -970,20 +1497,20 @@ class ScannerPage(QWidget):
         top.addWidget(self.drop_zone, 1)
         
         self.browse_btn = QPushButton("Browse")
-        self.browse_btn.setStyleSheet(BTN_DEFAULT)
+        self.browse_btn.setObjectName("btnDefault")
         self.browse_btn.setCursor(Qt.PointingHandCursor)
         self.browse_btn.clicked.connect(self._browse)
         top.addWidget(self.browse_btn)
         
         self.scan_btn = QPushButton("Scan")
-        self.scan_btn.setStyleSheet(BTN_PRIMARY)
+        self.scan_btn.setObjectName("btnPrimary")
         self.scan_btn.setCursor(Qt.PointingHandCursor)
         self.scan_btn.setEnabled(False)
         self.scan_btn.clicked.connect(self._scan)
         top.addWidget(self.scan_btn)
         
         self.stop_btn = QPushButton("Stop")
-        self.stop_btn.setStyleSheet(BTN_DANGER)
+        self.stop_btn.setObjectName("btnDanger")
         self.stop_btn.setCursor(Qt.PointingHandCursor)
         self.stop_btn.clicked.connect(self._stop)
         self.stop_btn.hide()
@@ -996,46 +1523,44 @@ class ScannerPage(QWidget):
         self.scroll.setWidgetResizable(True)
         self.scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.scroll.setStyleSheet(f"""
-            QScrollArea {{
-                background-color: {Colors.BG};
-                border: 1px solid {Colors.BORDER};
-                border-radius: 6px;
-            }}
-            QScrollArea > QWidget > QWidget {{
-                background-color: {Colors.BG};
-            }}
-        """)
+        self.scroll.setStyleSheet(SCROLLAREA_QSS)
         
         self.results = QWidget()
-        self.results.setStyleSheet(f"background-color: {Colors.BG}; border: none; border-radius: 6px;")
+        self.results.setObjectName("scanResults")
         self.results_layout = QVBoxLayout(self.results)
         self.results_layout.setAlignment(Qt.AlignTop)
         self.results_layout.setSpacing(8)
         self.results_layout.setContentsMargins(8, 8, 8, 8)
         
         self.empty = QLabel("Drop a file or folder to scan for locks")
-        self.empty.setStyleSheet(f"color: {Colors.TEXT_DIM}; font-size: 13px;")
+        self.empty.setObjectName("emptyLabel")
         self.empty.setAlignment(Qt.AlignCenter)
         self.results_layout.addWidget(self.empty)
         
         self.scroll.setWidget(self.results)
+        bar = self.scroll.verticalScrollBar()
+        bar.valueChanged.connect(self._page_in_if_at_bottom)
+        bar.rangeChanged.connect(self._page_in_if_at_bottom)
         layout.addWidget(self.scroll, 1)
         
+        # Locked files found but not yet given a card
+        self.more_hint = QLabel()
+        self.more_hint.setObjectName("moreHint")
+        self.more_hint.setAlignment(Qt.AlignCenter)
+        self.more_hint.hide()
+        layout.addWidget(self.more_hint)
+        
         # Bottom bar
         bottom = QHBoxLayout()
         
         self.progress = QProgressBar()
-        self.progress.setStyleSheet(f"""
-            QProgressBar {{ background-color: {Colors.BORDER}; border: none; border-radius: 2px; height: 4px; }}
-            QProgressBar::chunk {{ background-color: {Colors.ACCENT}; border-radius: 2px; }}
-        """)
+        self.progress.setStyleSheet(PROGRESS_QSS)
         self.progress.setTextVisible(False)
         self.progress.setFixedHeight(4)
         self.progress.hide()
         
         self.status = QLabel("Ready")
-        self.status.setStyleSheet(f"color: {Colors.TEXT_DIM}; font-size: 11px;")
+        self.status.setObjectName("statusLabel")
         
         status_layout = QVBoxLayout()
         status_layout.setSpacing(4)
@@ -1044,13 +1569,13 @@ class ScannerPage(QWidget):
         bottom.addLayout(status_layout, 1)
         
         reset_btn = QPushButton("Reset")
-        reset_btn.setStyleSheet(BTN_DEFAULT)
+        reset_btn.setObjectName("btnDefault")
         reset_btn.setCursor(Qt.PointingHandCursor)
         reset_btn.clicked.connect(self._reset)
         bottom.addWidget(reset_btn)
         
         export_btn = QPushButton("Export")
-        export_btn.setStyleSheet(BTN_DEFAULT)
+        export_btn.setObjectName("btnDefault")
         export_btn.setCursor(Qt.PointingHandCursor)
         export_btn.clicked.connect(self._export)
         bottom.addWidget(export_btn)
@@ -1062,8 +1587,12 @@ class ScannerPage(QWidget):
         self.scan_btn.setEnabled(True)
     
     def _browse(self):
-        path = QFileDialog.getExistingDirectory(self, "Select Folder")
+        path = QFileDialog.getExistingDirectory(
+            self, "Select Folder", self._last_browse_dir,
+            options=self._dialog_options | QFileDialog.ShowDirsOnly
+        )
         if path:
+            self._last_browse_dir = path
             self.current_path = path
             self.drop_zone.set_path(path)
             self.scan_btn.setEnabled(True)
@@ -1072,16 +1601,17 @@ class ScannerPage(QWidget):
         if not self.current_path:
             return
         self._clear()
-        self.locked_files = []
         self.scan_btn.hide()
         self.stop_btn.show()
         self.progress.show()
         self.progress.setValue(0)
+        self._last_ui_tick = 0.0
+        self._last_percent = -1
         
         # Reset scan tracking
         self._scan_start_time = time.time()
         self.last_scan_info = {
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": time.strftime(_TS_FMT),
             "path": self.current_path,
             "total_files": 0,
             "locked_count": 0,
@@ -1093,12 +1623,30 @@ class ScannerPage(QWidget):
             self.log_signal.log_scan_start(self.current_path)
         
         self.scanner = ScannerThread(self.current_path)
-        self.scanner.progress.connect(lambda s, t, f: (self.progress.setValue(int(s/t*100) if t else 0), self.status.setText(f"Scanning: {s}/{t}")))
-        self.scanner.file_found.connect(self._add_file)
+        self.scanner.progress.connect(self._on_progress)
+        self.scanner.files_found.connect(self._add_files)
         self.scanner.finished_scan.connect(self._done)
         self.scanner.log_message.connect(self._log_msg)
         self.scanner.start()
     
+    def _on_progress(self, scanned, total, filepath):
+        now = time.monotonic()
+        if now - self._last_ui_tick < self.PROGRESS_UI_INTERVAL and scanned != total:
+            return
+        self._last_ui_tick = now
+        
+        if total < 0:
+            # Still enumerating - busy indicator until the total is known
+            self.progress.setRange(0, 0)
+            self.status.setText(f"Scanning: {scanned} files")
+        else:
+            self.progress.setRange(0, 100)
+            percent = int(scanned / total * 100) if total else 0
+            if percent != self._last_percent:
+                self._last_percent = percent
+                self.progress.setValue(percent)
+            self.status.setText(f"Scanning: {scanned}/{total}")
+    
     def _log_msg(self, msg):
         if self.log_signal:
             self.log_signal.log(msg, "info")
@@ -1107,18 +1655,81 @@ class ScannerPage(QWidget):
         if self.scanner:
             self.scanner.stop()
     
+    def _add_files(self, files: List[LockedFile]):
+        self._pending.extend(files)
+        if len(self._pending) >= self.ADD_FLUSH_COUNT:
+            self._flush_pending()
+        elif not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def _flush_pending(self):
+        self._flush_timer.stop()
+        if not self._pending:
+            return
+        files, self._pending = self._pending, []
+        # One relayout for the whole batch instead of one per card
+        self.results.setUpdatesEnabled(False)
+        try:
+            for lf in files:
+                self._add_file(lf)
+        finally:
+            self.results.setUpdatesEnabled(True)
+        # Already at the end: no scroll will come to page the new files in
+        self._page_in_if_at_bottom()
+        self._update_more_hint()
+    
     def _add_file(self, lf):
         self.empty.hide()
-        self.locked_files.append(lf)
-        card = LockedFileCard(lf)
-        card.process_close.connect(self._close_proc)
-        card.auto_delete.connect(self._auto_del)
-        self.results_layout.addWidget(card)
+        self._lf_by_path[lf.path] = lf
+        if self._cards_shown < self._card_limit:
+            self._add_card(lf)
         
         if self.log_signal:
             self.log_signal.log_locked_file(lf)
     
+    def _add_card(self, lf):
+        if self._card_pool:
+            card = self._card_pool.pop()
+        else:
+            card = LockedFileCard()
+            card.process_close.connect(self._close_proc)
+            card.auto_delete.connect(self._auto_del)
+        card.bind(lf)
+        self.results_layout.addWidget(card)
+        card.show()
+        self._card_by_path[lf.path] = card
+        self._cards_shown += 1
+    
+    def _show_more_cards(self):
+        """Build cards for locked files that were held back, up to the limit."""
+        pending = list(islice(self._lf_by_path.values(), self._cards_shown, self._card_limit))
+        if pending:
+            self.results.setUpdatesEnabled(False)
+            try:
+                for lf in pending:
+                    self._add_card(lf)
+            finally:
+                self.results.setUpdatesEnabled(True)
+        self._update_more_hint()
+    
+    def _page_in_if_at_bottom(self, *_):
+        """Materialize the next page of cards while the list is scrolled to its end."""
+        bar = self.scroll.verticalScrollBar()
+        if bar.value() >= bar.maximum() - bar.pageStep() and self._cards_shown < len(self._lf_by_path):
+            self._card_limit += self.CARD_PAGE_SIZE
+            self._show_more_cards()
+    
+    def _update_more_hint(self):
+        hidden = len(self._lf_by_path) - self._cards_shown
+        if hidden > 0:
+            self.more_hint.setText(f"{hidden} more locked file{'s' if hidden != 1 else ''} - scroll down to show")
+            self.more_hint.show()
+        else:
+            self.more_hint.hide()
+    
     def _done(self, total, locked):
+        self._flush_pending()
+        self._page_in_if_at_bottom()
         self.stop_btn.hide()
         self.scan_btn.show()
         self.progress.hide()
@@ -1145,12 +1756,11 @@ class ScannerPage(QWidget):
     def _close_proc(self, pid, force, fp):
         # Find process name from locked files
         proc_name = "Unknown"
-        for lf in self.locked_files:
-            if lf.path == fp:
-                for p in lf.processes:
-                    if p.pid == pid:
-                        proc_name = p.name
-                        break
+        if (lf := self._lf_by_path.get(fp)):
+            for p in lf.processes:
+                if p.pid == pid:
+                    proc_name = p.name
+                    break
         
         def on_confirm(result):
             if result:
@@ -1174,7 +1784,7 @@ class ScannerPage(QWidget):
                     "pid": pid,
                     "success": ok,
                     "error": msg if not ok else None,
-                    "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
+                    "timestamp": time.strftime(_TS_FMT)
                 })
                 
                 # Short toast message
@@ -1193,6 +1803,9 @@ class ScannerPage(QWidget):
         )
     
     def _auto_del(self, fp):
+        if fp in self._deleting:
+            return self.toast_signal.emit("Delete already in progress", "info")
+        
         def on_confirm(confirmed):
             if confirmed:
                 filename = os.path.basename(fp)
@@ -1201,41 +1814,12 @@ class ScannerPage(QWidget):
                 if self.log_signal:
                     self.log_signal.log_action_start("Delete", fp, filename)
                 
-                # Create smart deleter with logging
-                def log_callback(msg, level):
-                    if self.log_signal:
-                        self.log_signal.log(msg, level)
-                
-                deleter = SmartFileDeleter(log_callback)
-                result = deleter.delete_file(fp, kill_processes=True)
-                
-                # Log final result
-                if self.log_signal:
-                    self.log_signal.log_delete_result(
-                        fp, 
-                        result.success, 
-                        len(result.attempts),
-                        result.processes_killed
-                    )
-                
-                # Track action for export
-                self.last_scan_info["actions"].append({
-                    "type": "Delete",
-                    "target": fp,
-                    "success": result.success,
-                    "attempts": len(result.attempts),
-                    "strategies_tried": [a.strategy for a in result.attempts],
-                    "processes_killed": result.processes_killed,
-                    "error": result.final_error if not result.success else None,
-                    "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
-                })
-                
-                # Short toast message
-                if result.success:
-                    self.toast_signal.emit("File deleted - see Log", "success")
-                    self._remove(fp)
-                else:
-                    self.toast_signal.emit("Delete failed - check Log", "error")
+                # Delete on the thread pool; results come back as queued signals
+                worker = DeleterWorker(fp, kill_processes=True)
+                worker.signals.log.connect(self._delete_log)
+                worker.signals.finished.connect(self._delete_done)
+                self._deleting.add(fp)
+                QThreadPool.globalInstance().start(worker)
         
         overlay = ModalOverlay(self.window())
         overlay.show_confirm(
@@ -1245,46 +1829,95 @@ class ScannerPage(QWidget):
             callback=on_confirm
         )
     
+    def _delete_log(self, msg, level):
+        if self.log_signal:
+            self.log_signal.log(msg, level)
+    
+    def _delete_done(self, result: DeleteResult):
+        fp = result.file_path
+        self._deleting.discard(fp)
+        
+        # Log final result
+        if self.log_signal:
+            self.log_signal.log_delete_result(
+                fp, 
+                result.success, 
+                len(result.attempts),
+                result.processes_killed
+            )
+        
+        # Track action for export
+        self.last_scan_info["actions"].append({
+            "type": "Delete",
+            "target": fp,
+            "success": result.success,
+            "attempts": len(result.attempts),
+            "strategies_tried": [a.strategy for a in result.attempts],
+            "processes_killed": result.processes_killed,
+            "error": result.final_error if not result.success else None,
+            "timestamp": time.strftime(_TS_FMT)
+        })
+        
+        # Short toast message
+        if result.success:
+            self.toast_signal.emit("File deleted - see Log", "success")
+            self._remove(fp)
+        else:
+            self.toast_signal.emit("Delete failed - check Log", "error")
+    
     def _refresh(self, fp):
         if not get_locking_processes(fp):
             self._remove(fp)
     
     def _remove(self, fp):
-        for i in range(self.results_layout.count()):
-            w = self.results_layout.itemAt(i).widget()
-            if isinstance(w, LockedFileCard) and w.locked_file.path == fp:
-                w.deleteLater()
-                self.locked_files = [f for f in self.locked_files if f.path != fp]
-                break
+        if self._lf_by_path.pop(fp, None) is None:
+            return
+        if (card := self._card_by_path.pop(fp, None)):
+            self.results_layout.removeWidget(card)
+            self._recycle(card)
+            self._cards_shown -= 1
+        self._show_more_cards()
+    
+    def _recycle(self, w):
+        """Keep a card for reuse, or drop any other results widget."""
+        if isinstance(w, LockedFileCard) and len(self._card_pool) < self.CARD_POOL_SIZE:
+            w.hide()
+            self._card_pool.append(w)
+        else:
+            # Detach now so results stops listing it before the deferred delete
+            w.setParent(None)
+            w.deleteLater()
     
     def _clear(self):
+        self._clear_results("Scanning...")
+    
+    def _clear_results(self, placeholder: str):
+        """Drop every result and its paging state, leaving only the placeholder label."""
         while self.results_layout.count():
             if (w := self.results_layout.takeAt(0).widget()):
-                w.deleteLater()
-        self.empty = QLabel("Scanning...")
-        self.empty.setStyleSheet(f"color: {Colors.TEXT_DIM}; font-size: 13px;")
+                self._recycle(w)
+        self._cards_shown = 0
+        self._card_limit = self.CARD_PAGE_SIZE
+        self._pending.clear()
+        self._flush_timer.stop()
+        self._lf_by_path.clear()
+        self._card_by_path.clear()
+        self.more_hint.hide()
+        self.empty = QLabel(placeholder)
+        self.empty.setObjectName("emptyLabel")
         self.empty.setAlignment(Qt.AlignCenter)
         self.results_layout.addWidget(self.empty)
     
     def _reset(self):
         """Reset the entire application state to initial."""
         # Check if already in initial state
-        if not self.has_scanned and not self.locked_files and not self.current_path:
+        if not self.has_scanned and not self._lf_by_path and not self.current_path:
             return self.toast_signal.emit("Already reset", "info")
         
-        # Clear results
-        while self.results_layout.count():
-            if (w := self.results_layout.takeAt(0).widget()):
-                w.deleteLater()
-        
-        # Reset empty label to initial state
-        self.empty = QLabel("Drop a file or folder to scan for locks")
-        self.empty.setStyleSheet(f"color: {Colors.TEXT_DIM}; font-size: 13px;")
-        self.empty.setAlignment(Qt.AlignCenter)
-        self.results_layout.addWidget(self.empty)
+        # Clear results, back to the initial empty label
+        self._clear_results("Drop a file or folder to scan for locks")
         
         # Clear data
-        self.locked_files = []
         self.current_path = ""
         self.has_scanned = False
         self.last_scan_info = {
@@ -1315,155 +1948,153 @@ class ScannerPage(QWidget):
         if not self.has_scanned:
             return self.toast_signal.emit("Please run a scan first", "warning")
         
-        if not self.locked_files and not self.last_scan_info["actions"]:
+        if not self._lf_by_path and not self.last_scan_info["actions"]:
             return self.toast_signal.emit("No data to export", "warning")
         
         # Get save path - default to detailed report name
-        default_name = f"unlock_report_{time.strftime('%Y%m%d_%H%M%S')}.txt"
+        default_name = os.path.join(self._last_export_dir, f"unlock_report_{time.strftime(_FILE_TS_FMT)}.txt")
         path, _ = QFileDialog.getSaveFileName(
             self, "Export Report", default_name,
-            "Text Report (*.txt);;CSV Data (*.csv);;All Files (*.*)"
+            "Text Report (*.txt);;CSV Data (*.csv);;All Files (*.*)",
+            options=self._dialog_options
         )
         
         if not path:
             return
+        self._last_export_dir = os.path.dirname(path)
         
         try:
+            report = self._build_report()
             with open(path, 'w', encoding='utf-8') as f:
-                self._write_detailed_report(f)
+                f.write(report)
             self.toast_signal.emit("Report exported", "success")
         except Exception as e:
             self.toast_signal.emit(f"Export failed: {str(e)[:30]}", "error")
     
-    def _write_detailed_report(self, f):
-        """Generate a comprehensive report file."""
+    def _build_report(self) -> str:
+        """Generate the comprehensive report text."""
         info = self.last_scan_info
+        parts: List[str] = []
+        now = time.strftime(_TS_FMT)
         
         # Header
-        f.write("=" * 70 + "\n")
-        f.write("                    UNLOCK INSPECTOR - SCAN REPORT\n")
-        f.write("=" * 70 + "\n\n")
+        parts.append(_H1_TITLE)
         
         # Scan Summary
-        f.write("SCAN SUMMARY\n")
-        f.write("-" * 40 + "\n")
-        f.write(f"Scan Date/Time:     {info['timestamp']}\n")
-        f.write(f"Target Path:        {info['path']}\n")
-        f.write(f"Total Files:        {info['total_files']}\n")
-        f.write(f"Locked Files Found: {info['locked_count']}\n")
-        f.write(f"Scan Duration:      {info['duration']} seconds\n")
-        f.write(f"Actions Performed:  {len(info['actions'])}\n")
-        f.write("\n")
+        parts.append("SCAN SUMMARY\n")
+        parts.append(_H2)
+        parts.append(f"Scan Date/Time:     {info['timestamp']}\n")
+        parts.append(f"Target Path:        {info['path']}\n")
+        parts.append(f"Total Files:        {info['total_files']}\n")
+        parts.append(f"Locked Files Found: {info['locked_count']}\n")
+        parts.append(f"Scan Duration:      {info['duration']} seconds\n")
+        parts.append(f"Actions Performed:  {len(info['actions'])}\n")
+        parts.append("\n")
         
         # System Info
-        f.write("SYSTEM INFORMATION\n")
-        f.write("-" * 40 + "\n")
-        f.write(f"Report Generated:   {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"Computer Name:      {os.environ.get('COMPUTERNAME', 'Unknown')}\n")
-        f.write(f"Username:           {os.environ.get('USERNAME', 'Unknown')}\n")
-        f.write(f"Windows Version:    {os.environ.get('OS', 'Unknown')}\n")
-        f.write("\n")
+        parts.append("SYSTEM INFORMATION\n")
+        parts.append(_H2)
+        parts.append(f"Report Generated:   {now}\n")
+        parts.append(f"Computer Name:      {os.environ.get('COMPUTERNAME', 'Unknown')}\n")
+        parts.append(f"Username:           {os.environ.get('USERNAME', 'Unknown')}\n")
+        parts.append(f"Windows Version:    {os.environ.get('OS', 'Unknown')}\n")
+        parts.append("\n")
         
         # Locked Files Details
-        if self.locked_files:
-            f.write("=" * 70 + "\n")
-            f.write("                         LOCKED FILES DETAILS\n")
-            f.write("=" * 70 + "\n\n")
+        if self._lf_by_path:
+            parts.append(_H1_FILES)
             
-            for idx, lf in enumerate(self.locked_files, 1):
-                f.write(f"[FILE {idx}]\n")
-                f.write("-" * 40 + "\n")
-                f.write(f"File Name:      {lf.filename}\n")
-                f.write(f"Full Path:      {lf.path}\n")
+            for idx, lf in enumerate(self._lf_by_path.values(), 1):
+                parts.append(f"[FILE {idx}]\n")
+                parts.append(_H2)
+                parts.append(f"File Name:      {lf.filename}\n")
+                parts.append(f"Full Path:      {lf.path}\n")
                 
                 # File metadata
                 try:
                     stat_info = os.stat(lf.path)
-                    f.write(f"File Size:      {self._format_size(stat_info.st_size)}\n")
-                    f.write(f"Modified:       {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(stat_info.st_mtime))}\n")
-                    f.write(f"Created:        {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(stat_info.st_ctime))}\n")
+                    parts.append(f"File Size:      {self._format_size(stat_info.st_size)}\n")
+                    parts.append(f"Modified:       {time.strftime(_TS_FMT, time.localtime(stat_info.st_mtime))}\n")
+                    parts.append(f"Created:        {time.strftime(_TS_FMT, time.localtime(stat_info.st_ctime))}\n")
                 except:
-                    f.write(f"File Size:      Unable to retrieve\n")
+                    parts.append(f"File Size:      Unable to retrieve\n")
                 
-                f.write(f"Lock Count:     {len(lf.processes)} process(es)\n")
-                f.write("\n")
+                parts.append(f"Lock Count:     {len(lf.processes)} process(es)\n")
+                parts.append("\n")
                 
                 # Process details
-                f.write("  LOCKING PROCESSES:\n")
+                parts.append("  LOCKING PROCESSES:\n")
                 for pidx, proc in enumerate(lf.processes, 1):
-                    f.write(f"  [{pidx}] {proc.name}\n")
-                    f.write(f"      PID:          {proc.pid}\n")
-                    f.write(f"      Type:         {proc.type_name}\n")
-                    f.write(f"      App Type ID:  {proc.app_type}\n")
-                f.write("\n")
+                    parts.append(f"  [{pidx}] {proc.name}\n")
+                    parts.append(f"      PID:          {proc.pid}\n")
+                    parts.append(f"      Type:         {proc.type_name}\n")
+                    parts.append(f"      App Type ID:  {proc.app_type}\n")
+                parts.append("\n")
         else:
-            f.write("=" * 70 + "\n")
-            f.write("                         NO LOCKED FILES\n")
-            f.write("=" * 70 + "\n")
-            f.write("No locked files were found during this scan session.\n")
-            f.write("\n")
+            parts.append(_H1_NO_FILES)
+            parts.append("No locked files were found during this scan session.\n")
+            parts.append("\n")
         
-        # Actions Performed
+        # Actions Performed - statistics are counted in the same pass
+        success_actions = close_count = delete_count = 0
         if info['actions']:
-            f.write("=" * 70 + "\n")
-            f.write("                         ACTIONS PERFORMED\n")
-            f.write("=" * 70 + "\n\n")
+            parts.append(_H1_ACTIONS)
             
             for idx, action in enumerate(info['actions'], 1):
+                if action['success']:
+                    success_actions += 1
                 status = "SUCCESS" if action['success'] else "FAILED"
-                f.write(f"[ACTION {idx}] {action['type']} - {status}\n")
-                f.write("-" * 40 + "\n")
-                f.write(f"Timestamp:      {action['timestamp']}\n")
-                f.write(f"Target:         {action['target']}\n")
+                parts.append(f"[ACTION {idx}] {action['type']} - {status}\n")
+                parts.append(_H2)
+                parts.append(f"Timestamp:      {action['timestamp']}\n")
+                parts.append(f"Target:         {action['target']}\n")
                 
                 if action['type'] in ['Close', 'Force Kill']:
-                    f.write(f"Process:        {action.get('process', 'N/A')}\n")
-                    f.write(f"PID:            {action.get('pid', 'N/A')}\n")
+                    close_count += 1
+                    parts.append(f"Process:        {action.get('process', 'N/A')}\n")
+                    parts.append(f"PID:            {action.get('pid', 'N/A')}\n")
                 elif action['type'] == 'Delete':
-                    f.write(f"Attempts:       {action.get('attempts', 'N/A')}\n")
+                    delete_count += 1
+                    parts.append(f"Attempts:       {action.get('attempts', 'N/A')}\n")
                     strategies = action.get('strategies_tried', [])
                     if strategies:
-                        f.write(f"Strategies:     {', '.join(strategies)}\n")
+                        parts.append(f"Strategies:     {', '.join(strategies)}\n")
                     procs = action.get('processes_killed', [])
                     if procs:
-                        f.write(f"Killed Procs:   {', '.join(procs)}\n")
+                        parts.append(f"Killed Procs:   {', '.join(procs)}\n")
                 
                 if action.get('error'):
-                    f.write(f"Error:          {action['error']}\n")
+                    parts.append(f"Error:          {action['error']}\n")
                 
-                f.write("\n")
+                parts.append("\n")
         
         # Statistics
-        f.write("=" * 70 + "\n")
-        f.write("                            STATISTICS\n")
-        f.write("=" * 70 + "\n\n")
+        parts.append(_H1_STATS)
         
         total_actions = len(info['actions'])
-        success_actions = sum(1 for a in info['actions'] if a['success'])
         failed_actions = total_actions - success_actions
         
-        close_actions = [a for a in info['actions'] if a['type'] in ['Close', 'Force Kill']]
-        delete_actions = [a for a in info['actions'] if a['type'] == 'Delete']
-        
-        f.write(f"Total Actions:          {total_actions}\n")
-        f.write(f"Successful:             {success_actions}\n")
-        f.write(f"Failed:                 {failed_actions}\n")
-        f.write(f"Process Close/Kill:     {len(close_actions)}\n")
-        f.write(f"File Deletions:         {len(delete_actions)}\n")
+        parts.append(f"Total Actions:          {total_actions}\n")
+        parts.append(f"Successful:             {success_actions}\n")
+        parts.append(f"Failed:                 {failed_actions}\n")
+        parts.append(f"Process Close/Kill:     {close_count}\n")
+        parts.append(f"File Deletions:         {delete_count}\n")
         
         if total_actions > 0:
             success_rate = (success_actions / total_actions) * 100
-            f.write(f"Success Rate:           {success_rate:.1f}%\n")
+            parts.append(f"Success Rate:           {success_rate:.1f}%\n")
         
-        f.write("\n")
+        parts.append("\n")
         
         # Footer
-        f.write("=" * 70 + "\n")
-        f.write("                          END OF REPORT\n")
-        f.write("=" * 70 + "\n")
-        f.write(f"Generated by Unlock Inspector | {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+        parts.append(_H1_END)
+        parts.append(f"Generated by Unlock Inspector | {now}\n")
+        
+        return "".join(parts)
     
-    def _format_size(self, size_bytes: int) -> str:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _format_size(size_bytes: int) -> str:
         """Format bytes to human readable size."""
         for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
             if size_bytes < 1024:
@@ -1474,24 +2105,139 @@ class ScannerPage(QWidget):
 
 # ============== Log Page ==============
 
+# Log colors - more vibrant and distinct
+LOG_INFO = "#64b5f6"       # Blue
+LOG_DEBUG = "#90a4ae"      # Gray
+LOG_WARN = "#ffb74d"       # Orange
+LOG_ERROR = "#ef5350"      # Red
+LOG_SUCCESS = "#81c784"    # Green
+LOG_LOCK = "#ce93d8"       # Purple (lock detection)
+LOG_FILE = "#4dd0e1"       # Cyan (file paths)
+LOG_PROCESS = "#ffab91"    # Coral (process names)
+LOG_PID = "#ffd54f"        # Yellow (PID)
+LOG_TIME = "#616161"       # Dark gray
+LOG_DIVIDER = "#9b7bcf"    # Accent purple
+
+_LOG_COLORS = {
+    "info": LOG_INFO,
+    "debug": LOG_DEBUG,
+    "warn": LOG_WARN,
+    "error": LOG_ERROR,
+    "success": LOG_SUCCESS,
+    "lock": LOG_LOCK,
+    "file": LOG_FILE,
+    "process": LOG_PROCESS,
+    "pid": LOG_PID,
+    "time": LOG_TIME,
+    "divider": LOG_DIVIDER,
+}
+
+_LOG_TAGS = {
+    "info": "INFO ",
+    "debug": "DEBUG", 
+    "warn": "WARN ",
+    "error": "ERROR",
+    "success": " OK  ",
+    "lock": "LOCK ",
+    "file": "FILE ",
+}
+
+_LOG_TS_FMT = "%H:%M:%S"
+
+# Box-drawing pieces of the multi-line log entries
+_BOX_TOP = "╔══════════════════════════════════════════════════════════╗"
+_BOX_BOTTOM = "╚══════════════════════════════════════════════════════════╝"
+_FILE_TOP = "┌─ FILE ─────────────────────────────────────────"
+_SECTION_BOTTOM = "└─────────────────────────────────────────────────"
+_PROC_BOTTOM = "└──────────────────────────────────────────────────"
+_PROC_TOP_TAIL = " ─────────────────────────────────────"
+_DELETE_OK_TOP = "┌─ DELETE SUCCESSFUL ────────────────────────────"
+_DELETE_FAIL_TOP = "┌─ DELETE FAILED ────────────────────────────────"
+_LOCK_BANNER = "━━━ LOCKED FILE DETECTED ━━━"
+
+# %-style span wrappers; LogPage._colored / _bold wrap them, hot paths use them directly
+_SPAN = '<span style="color: %s;">%s</span>'
+_SPAN_BOLD = '<span style="color: %s; font-weight: bold;">%s</span>'
+
+# Box-drawing lines with their colors already applied
+_HTML_BAR = _SPAN % (LOG_DIVIDER, "│")
+_HTML_BAR_OK = _SPAN % (LOG_SUCCESS, "│")
+_HTML_BAR_ERR = _SPAN % (LOG_ERROR, "│")
+_HTML_FILE_TOP = _SPAN % (LOG_DIVIDER, _FILE_TOP)
+_HTML_FILE_BOTTOM = _SPAN % (LOG_DIVIDER, _SECTION_BOTTOM)
+_HTML_PROC_BOTTOM = _SPAN % (LOG_DIVIDER, _PROC_BOTTOM)
+_HTML_LOCK_HEAD = f'{_SPAN_BOLD % (LOG_LOCK, "[LOCK ]")} {_SPAN_BOLD % (LOG_LOCK, _LOCK_BANNER)}'
+_HTML_BOX_TOP_OK = _SPAN_BOLD % (LOG_SUCCESS, _BOX_TOP)
+_HTML_BOX_BOTTOM_OK = _SPAN_BOLD % (LOG_SUCCESS, _BOX_BOTTOM)
+_HTML_BOX_TOP_WARN = _SPAN_BOLD % (LOG_WARN, _BOX_TOP)
+_HTML_BOX_BOTTOM_WARN = _SPAN_BOLD % (LOG_WARN, _BOX_BOTTOM)
+_HTML_DELETE_OK_TOP = _SPAN_BOLD % (LOG_SUCCESS, _DELETE_OK_TOP)
+_HTML_DELETE_OK_BOTTOM = _SPAN_BOLD % (LOG_SUCCESS, _SECTION_BOTTOM)
+_HTML_DELETE_FAIL_TOP = _SPAN_BOLD % (LOG_ERROR, _DELETE_FAIL_TOP)
+_HTML_DELETE_FAIL_BOTTOM = _SPAN_BOLD % (LOG_ERROR, _SECTION_BOTTOM)
+
+_WELCOME_LINES = (
+    _SPAN % (LOG_DIVIDER, _BOX_TOP),
+    f'<span style="color: {Colors.TEXT}; font-weight: bold;">                      UNLOCK INSPECTOR</span>',
+    f'<span style="color: {Colors.TEXT_DIM};">                Ready to scan for locked files</span>',
+    _SPAN % (LOG_DIVIDER, _BOX_BOTTOM),
+    '',
+)
+
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+# One ready-made %-template per level: colors and tag baked in, (ts, msg) left
+_LOG_TEMPLATES = {
+    level: (f'<span style="color: {LOG_TIME};">[%s]</span> '
+            f'<span style="color: {color}; font-weight: bold;">[{_LOG_TAGS.get(level, "INFO ")}]</span> '
+            f'<span style="color: {color};">%s</span>')
+    for level, color in _LOG_COLORS.items()
+}
+
+
 class LogPage(QWidget):
-    # Log colors - more vibrant and distinct
-    LOG_COLORS = {
-        "info": "#64b5f6",       # Blue
-        "debug": "#90a4ae",      # Gray
-        "warn": "#ffb74d",       # Orange
-        "error": "#ef5350",      # Red
-        "success": "#81c784",    # Green
-        "lock": "#ce93d8",       # Purple (lock detection)
-        "file": "#4dd0e1",       # Cyan (file paths)
-        "process": "#ffab91",    # Coral (process names) - NEW
-        "pid": "#ffd54f",        # Yellow (PID) - NEW
-        "time": "#616161",       # Dark gray
-        "divider": "#9b7bcf",    # Accent purple
-    }
+    MAX_LINES = 5000  # lines kept in the log view
+    HISTORY_LINES = 10000  # lines kept for Copy, beyond what the view holds
+    FLUSH_DELAY_MS = 40  # collect lines this long before rendering them
+    
+    # Whole "delete failed" box, one line per log block; fill with (filename, filepath, attempts)
+    _FAIL_FOOTER_TPL = "\n".join((
+        _HTML_DELETE_FAIL_TOP,
+        f'{_HTML_BAR_ERR}  {_SPAN % (LOG_TIME, "File:")}     {_SPAN_BOLD % (Colors.TEXT, "%s")}',
+        f'{_HTML_BAR_ERR}  {_SPAN % (LOG_TIME, "Path:")}     {_SPAN % (LOG_FILE, "%s")}',
+        f'{_HTML_BAR_ERR}  {_SPAN % (LOG_TIME, "Attempts:")} {_SPAN % (LOG_WARN, "%s")}',
+        _HTML_BAR_ERR,
+        f'{_HTML_BAR_ERR}  {_SPAN_BOLD % (LOG_WARN, "File could not be deleted. Possible causes:")}',
+        f'{_HTML_BAR_ERR}  - Process respawned after being killed',
+        f'{_HTML_BAR_ERR}  - System file or protected resource',
+        f'{_HTML_BAR_ERR}  - Insufficient permissions',
+        _HTML_DELETE_FAIL_BOTTOM,
+    ))
     
     def __init__(self):
         super().__init__()
+        self.verbose = False  # show "debug" level lines
+        self._welcomed = False  # banner is added on first show
+        self._ts_cache = (0, "")  # (epoch second, formatted clock)
+        # Lines waiting to be rendered; bounded like the view itself
+        self._pending: deque = deque(maxlen=self.MAX_LINES)
+        self._history: deque = deque(maxlen=self.HISTORY_LINES)
+        self._copy_text: Optional[str] = None  # joined history, dropped on change
+        # Blank formats for each new block, built once rather than per line
+        self._block_fmt = QTextBlockFormat()
+        self._char_fmt = QTextCharFormat()
+        
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_DELAY_MS)
+        self._flush_timer.timeout.connect(self._flush)
+        
+        # Scroll to the end once per event-loop pass, however many flushes ran
+        self._end_timer = QTimer(self)
+        self._end_timer.setSingleShot(True)
+        self._end_timer.setInterval(0)
+        self._end_timer.timeout.connect(lambda: self.output.moveCursor(QTextCursor.End))
+        
         self._setup_ui()
     
     def _setup_ui(self):
@@ -1505,28 +2251,30 @@ class LogPage(QWidget):
         
         # Title box matching DropZone width
         title_box = QFrame()
-        title_box.setStyleSheet(f"""
-            QFrame {{
-                background-color: {Colors.BG_CARD};
-                border: none;
-                border-radius: 6px;
-            }}
-        """)
+        title_box.setObjectName("logTitleBox")
         title_layout = QHBoxLayout(title_box)
         title_layout.setContentsMargins(12, 8, 12, 8)
         title = QLabel("Scan Log")
-        title.setStyleSheet(f"color: {Colors.TEXT}; font-size: 13px; font-weight: bold;")
+        title.setObjectName("logTitle")
         title_layout.addWidget(title)
         top.addWidget(title_box, 1)
         
+        self.verbose_btn = QPushButton("Debug")
+        self.verbose_btn.setCheckable(True)
+        self.verbose_btn.setObjectName("btnDefault")
+        self.verbose_btn.setCursor(Qt.PointingHandCursor)
+        self.verbose_btn.setToolTip("Show debug lines (per-strategy delete errors)")
+        self.verbose_btn.toggled.connect(self._set_verbose)
+        top.addWidget(self.verbose_btn)
+        
         copy_btn = QPushButton("Copy")
-        copy_btn.setStyleSheet(BTN_DEFAULT)
+        copy_btn.setObjectName("btnDefault")
         copy_btn.setCursor(Qt.PointingHandCursor)
         copy_btn.clicked.connect(self._copy_all)
         top.addWidget(copy_btn)
         
         clear_btn = QPushButton("Clear")
-        clear_btn.setStyleSheet(BTN_PRIMARY)
+        clear_btn.setObjectName("btnPrimary")
         clear_btn.setCursor(Qt.PointingHandCursor)
         clear_btn.clicked.connect(self._clear)
         top.addWidget(clear_btn)
@@ -1534,226 +2282,246 @@ class LogPage(QWidget):
         layout.addLayout(top)
         
         # Log output - matches scroll area position
-        self.output = QTextEdit()
+        self.output = QPlainTextEdit()
         self.output.setReadOnly(True)
-        self.output.setStyleSheet(f"""
-            QTextEdit {{
-                background-color: #0d0d0d;
-                color: #b0b0b0;
-                font-family: Consolas, 'Courier New', monospace;
-                font-size: 12px;
-                border: 1px solid {Colors.BORDER};
-                border-radius: 6px;
-                padding: 12px;
-                selection-background-color: {Colors.ACCENT};
-            }}
-            QScrollBar:vertical {{
-                background: transparent;
-                width: 8px;
-                margin: 4px 2px 4px 2px;
-            }}
-            QScrollBar::handle:vertical {{
-                background: rgba(155, 123, 207, 0.4);
-                border-radius: 4px;
-                min-height: 30px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background: rgba(155, 123, 207, 0.6);
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                height: 0;
-            }}
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
-                background: transparent;
-            }}
-        """)
-        self._append_welcome()
+        self.output.setMaximumBlockCount(self.MAX_LINES)
+        self.output.setStyleSheet(TEXTEDIT_QSS)
         layout.addWidget(self.output, 1)
     
-    def _append_welcome(self):
-        c = self.LOG_COLORS
-        self.output.append(f'<span style="color: {c["divider"]};">╔══════════════════════════════════════════════════════════╗</span>')
-        self.output.append(f'<span style="color: {Colors.TEXT}; font-weight: bold;">                      UNLOCK INSPECTOR</span>')
-        self.output.append(f'<span style="color: {Colors.TEXT_DIM};">                Ready to scan for locked files</span>')
-        self.output.append(f'<span style="color: {c["divider"]};">╚══════════════════════════════════════════════════════════╝</span>')
-        self.output.append('')
-    
-    def _ts(self) -> str:
-        return time.strftime("%H:%M:%S")
-    
+    def _append(self, line):
+        """Queue an HTML line, or a raw (time, message, level) entry from log()."""
+        self._pending.append(line)
+        self._history.append(line)
+        self._copy_text = None
+        # While the page is hidden lines just wait; showEvent renders them
+        if self.isVisible() and not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def _extend(self, lines: List[str]):
+        """Queue several HTML lines at once."""
+        self._pending.extend(lines)
+        self._history.extend(lines)
+        self._copy_text = None
+        if self.isVisible() and not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._welcomed:
+            # Banner goes ahead of anything logged before the page was opened
+            self._welcomed = True
+            welcome = _WELCOME_LINES
+            self._pending = deque([*welcome, *self._pending], maxlen=self.MAX_LINES)
+            self._history = deque([*welcome, *self._history], maxlen=self.HISTORY_LINES)
+            self._copy_text = None
+        self._flush()
+    
+    def _flush(self):
+        """Render pending lines as a single document edit."""
+        self._flush_timer.stop()
+        if not self._pending:
+            return
+        doc = self.output.document()
+        cursor = QTextCursor(doc)
+        cursor.movePosition(QTextCursor.End)
+        block_fmt, char_fmt = self._block_fmt, self._char_fmt
+        cursor.beginEditBlock()  # one relayout for the whole batch
+        for line in self._pending:
+            if not doc.isEmpty():
+                # Fresh formats so an unstyled line doesn't inherit the last color
+                cursor.insertBlock(block_fmt, char_fmt)
+            cursor.insertHtml(line if isinstance(line, str) else self._render(line))
+        cursor.endEditBlock()
+        self._pending.clear()
+        if not self._end_timer.isActive():
+            self._end_timer.start()
+    
+    def _set_verbose(self, checked: bool):
+        # The checked look comes from the #btnDefault:checked rule in APP_QSS
+        self.verbose = checked
+    
+    def _ts(self, t: Optional[float] = None) -> str:
+        # Clock has 1 s resolution - only reformat when the second changes
+        sec = int(time.time() if t is None else t)
+        if sec != self._ts_cache[0]:
+            self._ts_cache = (sec, time.strftime(_LOG_TS_FMT, time.localtime(sec)))
+        return self._ts_cache[1]
+    
+    # Both escape text: _plain unescapes every HTML line for Copy
     def _colored(self, text: str, color: str) -> str:
-        return f'<span style="color: {color};">{text}</span>'
+        return _SPAN % (color, escape(text))
     
     def _bold(self, text: str, color: str) -> str:
-        return f'<span style="color: {color}; font-weight: bold;">{text}</span>'
+        return _SPAN_BOLD % (color, escape(text))
     
     def log(self, message: str, level: str = "info"):
-        c = self.LOG_COLORS
-        color = c.get(level, c["info"])
-        
-        tags = {
-            "info": "INFO ",
-            "debug": "DEBUG", 
-            "warn": "WARN ",
-            "error": "ERROR",
-            "success": " OK  ",
-            "lock": "LOCK ",
-            "file": "FILE ",
-        }
-        tag = tags.get(level, "INFO ")
-        
-        line = f'{self._colored(f"[{self._ts()}]", c["time"])} {self._bold(f"[{tag}]", color)} {self._colored(message, color)}'
-        self.output.append(line)
-        self.output.moveCursor(QTextCursor.End)
+        if level == "debug" and not self.verbose:
+            return
+        # Kept raw; the HTML is only built once the page is on screen
+        self._append((time.time(), message, level))
+    
+    def _render(self, entry, _tpl=_LOG_TEMPLATES, _escape=escape) -> str:
+        # Templates and escape bound as defaults: local lookups on the hot path
+        t, message, level = entry
+        tpl = _tpl.get(level) or _tpl["info"]
+        return tpl % (self._ts(t), _escape(message))
     
     def log_locked_file(self, lf: LockedFile):
-        c = self.LOG_COLORS
+        # Spans are formatted in place: this runs once per locked file found.
+        # Dynamic fields are escaped by hand, as _colored/_bold would
+        lines = []
         
-        self.output.append('')
-        self.output.append(f'{self._colored(f"[{self._ts()}]", c["time"])} {self._bold("[LOCK ]", c["lock"])} {self._bold("━━━ LOCKED FILE DETECTED ━━━", c["lock"])}')
-        self.output.append('')
+        lines.append('')
+        lines.append(f'{_SPAN % (LOG_TIME, f"[{self._ts()}]")} {_HTML_LOCK_HEAD}')
+        lines.append('')
         
         # File section
-        self.output.append(f'    {self._colored("┌─ FILE ─────────────────────────────────────────", c["divider"])}')
-        self.output.append(f'    {self._colored("│", c["divider"])}  {self._colored("Name:", c["time"])}  {self._bold(lf.filename, Colors.TEXT)}')
-        self.output.append(f'    {self._colored("│", c["divider"])}  {self._colored("Path:", c["time"])}  {self._colored(lf.path, c["file"])}')
-        self.output.append(f'    {self._colored("│", c["divider"])}  {self._colored("Locks:", c["time"])} {self._bold(str(len(lf.processes)), c["warn"])}')
-        self.output.append(f'    {self._colored("└─────────────────────────────────────────────────", c["divider"])}')
-        self.output.append('')
+        lines.append(f'    {_HTML_FILE_TOP}')
+        lines.append(f'    {_HTML_BAR}  {_SPAN % (LOG_TIME, "Name:")}  {_SPAN_BOLD % (Colors.TEXT, escape(lf.filename))}')
+        lines.append(f'    {_HTML_BAR}  {_SPAN % (LOG_TIME, "Path:")}  {_SPAN % (LOG_FILE, escape(lf.path))}')
+        lines.append(f'    {_HTML_BAR}  {_SPAN % (LOG_TIME, "Locks:")} {_SPAN_BOLD % (LOG_WARN, len(lf.processes))}')
+        lines.append(f'    {_HTML_FILE_BOTTOM}')
+        lines.append('')
         
         # Process section for each process
         for i, p in enumerate(lf.processes):
-            self.output.append(f'    {self._colored("┌─ PROCESS " + str(i+1) + " ─────────────────────────────────────", c["divider"])}')
-            self.output.append(f'    {self._colored("│", c["divider"])}')
-            self.output.append(f'    {self._colored("│", c["divider"])}    {self._colored("Name:", c["time"])}    {self._bold(p.name, c["process"])}')
-            self.output.append(f'    {self._colored("│", c["divider"])}    {self._bold("PID:", c["time"])}     {self._bold(str(p.pid), c["pid"])}')
-            self.output.append(f'    {self._colored("│", c["divider"])}    {self._colored("Type:", c["time"])}    {self._colored(p.type_name, c["info"])}')
-            self.output.append(f'    {self._colored("│", c["divider"])}')
-            self.output.append(f'    {self._colored("└──────────────────────────────────────────────────", c["divider"])}')
+            lines.append(f'    {_SPAN % (LOG_DIVIDER, f"┌─ PROCESS {i + 1}{_PROC_TOP_TAIL}")}')
+            lines.append(f'    {_HTML_BAR}')
+            lines.append(f'    {_HTML_BAR}    {_SPAN % (LOG_TIME, "Name:")}    {_SPAN_BOLD % (LOG_PROCESS, escape(p.name))}')
+            lines.append(f'    {_HTML_BAR}    {_SPAN_BOLD % (LOG_TIME, "PID:")}     {_SPAN_BOLD % (LOG_PID, p.pid)}')
+            lines.append(f'    {_HTML_BAR}    {_SPAN % (LOG_TIME, "Type:")}    {_SPAN % (LOG_INFO, p.type_name)}')
+            lines.append(f'    {_HTML_BAR}')
+            lines.append(f'    {_HTML_PROC_BOTTOM}')
         
-        self.output.append('')
-        self.output.moveCursor(QTextCursor.End)
+        lines.append('')
+        self._extend(lines)
     
     def log_scan_start(self, path: str):
-        c = self.LOG_COLORS
+        lines = []
         
-        self.output.append('')
-        self.output.append(f'{self._bold("╔══════════════════════════════════════════════════════════╗", c["success"])}')
-        self.output.append(f'{self._colored(f"[{self._ts()}]", c["time"])} {self._bold("[START]", c["success"])} {self._bold("Scan started", c["success"])}')
-        self.output.append(f'            {self._colored("Target:", c["time"])} {self._colored(path, c["file"])}')
-        self.output.append(f'{self._bold("╚══════════════════════════════════════════════════════════╝", c["success"])}')
-        self.output.append('')
-        self.output.moveCursor(QTextCursor.End)
+        lines.append('')
+        lines.append(_HTML_BOX_TOP_OK)
+        lines.append(f'{self._colored(f"[{self._ts()}]", LOG_TIME)} {self._bold("[START]", LOG_SUCCESS)} {self._bold("Scan started", LOG_SUCCESS)}')
+        lines.append(f'            {self._colored("Target:", LOG_TIME)} {self._colored(path, LOG_FILE)}')
+        lines.append(_HTML_BOX_BOTTOM_OK)
+        lines.append('')
+        self._extend(lines)
     
     def log_scan_end(self, total: int, locked: int):
-        c = self.LOG_COLORS
-        c_result = c["success"] if locked == 0 else c["warn"]
+        lines = []
+        c_result = LOG_SUCCESS if locked == 0 else LOG_WARN
+        box_top, box_bottom = (_HTML_BOX_TOP_OK, _HTML_BOX_BOTTOM_OK) if locked == 0 else (_HTML_BOX_TOP_WARN, _HTML_BOX_BOTTOM_WARN)
         
-        self.output.append('')
-        self.output.append(f'{self._bold("╔══════════════════════════════════════════════════════════╗", c_result)}')
+        lines.append('')
+        lines.append(box_top)
         status = "COMPLETE - No locks found" if locked == 0 else f"COMPLETE - {locked} locked file(s) found"
-        self.output.append(f'{self._colored(f"[{self._ts()}]", c["time"])} {self._bold("[ END ]", c_result)} {self._bold(status, c_result)}')
-        self.output.append('')
-        self.output.append(f'            {self._colored("Total scanned:", c["time"])}  {self._bold(str(total), Colors.TEXT)}')
-        self.output.append(f'            {self._colored("Locked files:", c["time"])}  {self._bold(str(locked), c_result)}')
-        self.output.append('')
-        self.output.append(f'{self._bold("╚══════════════════════════════════════════════════════════╝", c_result)}')
-        self.output.append('')
-        self.output.moveCursor(QTextCursor.End)
+        lines.append(f'{self._colored(f"[{self._ts()}]", LOG_TIME)} {self._bold("[ END ]", c_result)} {self._bold(status, c_result)}')
+        lines.append('')
+        lines.append(f'            {self._colored("Total scanned:", LOG_TIME)}  {self._bold(str(total), Colors.TEXT)}')
+        lines.append(f'            {self._colored("Locked files:", LOG_TIME)}  {self._bold(str(locked), c_result)}')
+        lines.append('')
+        lines.append(box_bottom)
+        lines.append('')
+        self._extend(lines)
     
     def _copy_all(self):
-        QApplication.clipboard().setText(self.output.toPlainText())
+        if self._copy_text is None:
+            plain = self._plain
+            self._copy_text = "\n".join(plain(line) for line in self._history)
+        QApplication.clipboard().setText(self._copy_text)
+    
+    def _plain(self, line) -> str:
+        if isinstance(line, str):
+            return unescape(_HTML_TAG_RE.sub("", line))
+        t, message, level = line
+        return f'[{self._ts(t)}] [{_LOG_TAGS.get(level, "INFO ")}] {message}'
     
     def _clear(self):
+        self._pending.clear()
+        self._history.clear()
+        self._copy_text = None
         self.output.clear()
-        self._append_welcome()
+        if self._welcomed:
+            self._extend(_WELCOME_LINES)
     
     # ===== Action Logging Methods =====
     
     def log_action_start(self, action: str, target: str, details: str = ""):
         """Log the start of an action (Close, Force, Delete)."""
-        c = self.LOG_COLORS
+        lines = []
         action_colors = {
-            "close": c["info"],
-            "force": c["warn"],
-            "delete": c["error"],
+            "close": LOG_INFO,
+            "force": LOG_WARN,
+            "delete": LOG_ERROR,
         }
-        color = action_colors.get(action.lower(), c["info"])
+        color = action_colors.get(action.lower(), LOG_INFO)
         
-        self.output.append('')
-        self.output.append(f'{self._colored(f"[{self._ts()}]", c["time"])} {self._bold(f"[{action.upper():6}]", color)} {self._bold(f"Starting {action}...", color)}')
-        self.output.append(f'            {self._colored("Target:", c["time"])} {self._colored(target, c["file"])}')
+        lines.append('')
+        lines.append(f'{self._colored(f"[{self._ts()}]", LOG_TIME)} {self._bold(f"[{action.upper():6}]", color)} {self._bold(f"Starting {action}...", color)}')
+        lines.append(f'            {self._colored("Target:", LOG_TIME)} {self._colored(target, LOG_FILE)}')
         if details:
-            self.output.append(f'            {self._colored("Details:", c["time"])} {self._colored(details, c["process"])}')
-        self.output.moveCursor(QTextCursor.End)
+            lines.append(f'            {self._colored("Details:", LOG_TIME)} {self._colored(details, LOG_PROCESS)}')
+        self._extend(lines)
     
     def log_action_result(self, action: str, success: bool, message: str):
         """Log the result of an action."""
-        c = self.LOG_COLORS
-        color = c["success"] if success else c["error"]
+        lines = []
+        color = LOG_SUCCESS if success else LOG_ERROR
         status = "SUCCESS" if success else "FAILED"
         
-        self.output.append(f'{self._colored(f"[{self._ts()}]", c["time"])} {self._bold(f"[{status:6}]", color)} {self._colored(message, color)}')
-        self.output.append('')
-        self.output.moveCursor(QTextCursor.End)
+        lines.append(f'{self._colored(f"[{self._ts()}]", LOG_TIME)} {self._bold(f"[{status:6}]", color)} {self._colored(message, color)}')
+        lines.append('')
+        self._extend(lines)
     
     def log_process_action(self, action: str, process_name: str, pid: int, success: bool, error: str = ""):
         """Log a process-related action (close/force kill)."""
-        c = self.LOG_COLORS
-        color = c["success"] if success else c["error"]
+        lines = []
+        color = LOG_SUCCESS if success else LOG_ERROR
         
-        self.output.append('')
-        self.output.append(f'{self._colored(f"[{self._ts()}]", c["time"])} {self._bold(f"[PROC  ]", c["process"])} {self._bold(action, c["info"])}')
-        self.output.append(f'            {self._colored("Process:", c["time"])} {self._bold(process_name, c["process"])}')
-        self.output.append(f'            {self._colored("PID:", c["time"])}     {self._bold(str(pid), c["pid"])}')
+        lines.append('')
+        lines.append(f'{self._colored(f"[{self._ts()}]", LOG_TIME)} {self._bold(f"[PROC  ]", LOG_PROCESS)} {self._bold(action, LOG_INFO)}')
+        lines.append(f'            {self._colored("Process:", LOG_TIME)} {self._bold(process_name, LOG_PROCESS)}')
+        lines.append(f'            {self._colored("PID:", LOG_TIME)}     {self._bold(str(pid), LOG_PID)}')
         
         if success:
-            self.output.append(f'            {self._colored("Status:", c["time"])}  {self._bold("SUCCESS", c["success"])}')
+            lines.append(f'            {self._colored("Status:", LOG_TIME)}  {self._bold("SUCCESS", LOG_SUCCESS)}')
         else:
-            self.output.append(f'            {self._colored("Status:", c["time"])}  {self._bold("FAILED", c["error"])}')
+            lines.append(f'            {self._colored("Status:", LOG_TIME)}  {self._bold("FAILED", LOG_ERROR)}')
             if error:
-                self.output.append(f'            {self._colored("Error:", c["time"])}   {self._colored(error, c["error"])}')
+                lines.append(f'            {self._colored("Error:", LOG_TIME)}   {self._colored(error, LOG_ERROR)}')
         
-        self.output.append('')
-        self.output.moveCursor(QTextCursor.End)
+        lines.append('')
+        self._extend(lines)
     
     def log_delete_attempt(self, filepath: str, attempt: int, strategy: str, success: bool, error: str = ""):
         """Log a file deletion attempt."""
-        c = self.LOG_COLORS
-        color = c["success"] if success else c["warn"]
+        lines = []
+        color = LOG_SUCCESS if success else LOG_WARN
         
-        self.output.append(f'{self._colored(f"[{self._ts()}]", c["time"])} {self._colored(f"[ATT {attempt}]", c["info"])} {self._colored(f"Strategy: {strategy}", color)}')
+        lines.append(f'{self._colored(f"[{self._ts()}]", LOG_TIME)} {self._colored(f"[ATT {attempt}]", LOG_INFO)} {self._colored(f"Strategy: {strategy}", color)}')
         if not success and error:
-            self.output.append(f'            {self._colored("Reason:", c["time"])}  {self._colored(error, c["warn"])}')
-        self.output.moveCursor(QTextCursor.End)
+            lines.append(f'            {self._colored("Reason:", LOG_TIME)}  {self._colored(error, LOG_WARN)}')
+        self._extend(lines)
     
     def log_delete_result(self, filepath: str, success: bool, attempts: int, processes_killed: List[str] = None):
         """Log the final result of a file deletion."""
-        c = self.LOG_COLORS
-        filename = os.path.basename(filepath)
+        lines = []
+        filename = escape(os.path.basename(filepath))
         
-        self.output.append('')
+        lines.append('')
         if success:
-            self.output.append(f'{self._bold("┌─ DELETE SUCCESSFUL ────────────────────────────", c["success"])}')
-            self.output.append(f'{self._colored("│", c["success"])}  {self._colored("File:", c["time"])}     {self._bold(filename, Colors.TEXT)}')
-            self.output.append(f'{self._colored("│", c["success"])}  {self._colored("Attempts:", c["time"])} {self._colored(str(attempts), c["info"])}')
+            lines.append(_HTML_DELETE_OK_TOP)
+            lines.append(f'{_HTML_BAR_OK}  {_SPAN % (LOG_TIME, "File:")}     {_SPAN_BOLD % (Colors.TEXT, filename)}')
+            lines.append(f'{_HTML_BAR_OK}  {_SPAN % (LOG_TIME, "Attempts:")} {_SPAN % (LOG_INFO, attempts)}')
             if processes_killed:
-                self.output.append(f'{self._colored("│", c["success"])}  {self._colored("Killed:", c["time"])}   {self._colored(", ".join(processes_killed), c["process"])}')
-            self.output.append(f'{self._bold("└─────────────────────────────────────────────────", c["success"])}')
+                lines.append(f'{_HTML_BAR_OK}  {_SPAN % (LOG_TIME, "Killed:")}   {_SPAN % (LOG_PROCESS, escape(", ".join(processes_killed)))}')
+            lines.append(_HTML_DELETE_OK_BOTTOM)
         else:
-            self.output.append(f'{self._bold("┌─ DELETE FAILED ────────────────────────────────", c["error"])}')
-            self.output.append(f'{self._colored("│", c["error"])}  {self._colored("File:", c["time"])}     {self._bold(filename, Colors.TEXT)}')
-            self.output.append(f'{self._colored("│", c["error"])}  {self._colored("Path:", c["time"])}     {self._colored(filepath, c["file"])}')
-            self.output.append(f'{self._colored("│", c["error"])}  {self._colored("Attempts:", c["time"])} {self._colored(str(attempts), c["warn"])}')
-            self.output.append(f'{self._colored("│", c["error"])}')
-            self.output.append(f'{self._colored("│", c["error"])}  {self._bold("File could not be deleted. Possible causes:", c["warn"])}')
-            self.output.append(f'{self._colored("│", c["error"])}  - Process respawned after being killed')
-            self.output.append(f'{self._colored("│", c["error"])}  - System file or protected resource')
-            self.output.append(f'{self._colored("│", c["error"])}  - Insufficient permissions')
-            self.output.append(f'{self._bold("└─────────────────────────────────────────────────", c["error"])}')
+            # Windows paths cannot contain newlines, so splitting only cuts the template's own breaks
+            lines.extend((self._FAIL_FOOTER_TPL % (filename, escape(filepath), attempts)).split("\n"))
         
-        self.output.append('')
-        self.output.moveCursor(QTextCursor.End)
+        lines.append('')
+        self._extend(lines)
 
 
 # ============== Info Page ==============
@@ -1774,56 +2542,28 @@ class InfoPage(QWidget):
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll.setStyleSheet(f"""
-            QScrollArea {{
-                background-color: {Colors.BG};
-                border: 1px solid {Colors.BORDER};
-                border-radius: 6px;
-            }}
-            QScrollArea > QWidget > QWidget {{
-                background-color: {Colors.BG};
-            }}
-            QScrollBar:vertical {{
-                background: transparent;
-                width: 8px;
-                margin: 4px 2px 4px 2px;
-            }}
-            QScrollBar::handle:vertical {{
-                background: rgba(155, 123, 207, 0.4);
-                border-radius: 4px;
-                min-height: 30px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background: rgba(155, 123, 207, 0.6);
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                height: 0;
-            }}
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
-                background: transparent;
-            }}
-        """)
+        scroll.setStyleSheet(SCROLLAREA_QSS + LOG_SCROLLBAR_QSS)
         
         content = QWidget()
-        content.setStyleSheet(f"background-color: {Colors.BG}; border: none;")
+        content.setObjectName("infoContent")
         content_layout = QVBoxLayout(content)
         content_layout.setContentsMargins(16, 16, 16, 16)
         content_layout.setSpacing(16)
         
         # Title section
         title_frame = QFrame()
-        title_frame.setStyleSheet(f"background: {Colors.BG_CARD}; border: 1px solid {Colors.ACCENT}; border-radius: 8px;")
+        title_frame.setObjectName("infoHeader")
         title_layout = QVBoxLayout(title_frame)
         title_layout.setContentsMargins(16, 14, 16, 14)
         title_layout.setSpacing(8)
         
         title = QLabel("Unlock Inspector")
-        title.setStyleSheet(f"color: {Colors.ACCENT}; font-size: 18px; font-weight: bold; border: none; background: transparent;")
+        title.setObjectName("infoHeading")
         title.setAlignment(Qt.AlignCenter)
         title_layout.addWidget(title)
         
         subtitle = QLabel("File Lock Detection & Process Management Tool")
-        subtitle.setStyleSheet(f"color: {Colors.TEXT_DIM}; font-size: 12px; border: none; background: transparent;")
+        subtitle.setObjectName("infoSubtitle")
         subtitle.setAlignment(Qt.AlignCenter)
         title_layout.addWidget(subtitle)
         
@@ -1855,13 +2595,13 @@ class InfoPage(QWidget):
         
         # Tips section
         tips_frame = QFrame()
-        tips_frame.setStyleSheet(f"background: {Colors.BG_CARD}; border: 1px solid {Colors.WARNING}; border-radius: 8px;")
+        tips_frame.setObjectName("infoTips")
         tips_layout = QVBoxLayout(tips_frame)
         tips_layout.setContentsMargins(16, 12, 16, 12)
         tips_layout.setSpacing(8)
         
         tips_title = QLabel("Tips")
-        tips_title.setStyleSheet(f"color: {Colors.WARNING}; font-size: 14px; font-weight: bold; border: none; background: transparent;")
+        tips_title.setObjectName("infoTipsTitle")
         tips_layout.addWidget(tips_title)
         
         tips = [
@@ -1873,7 +2613,7 @@ class InfoPage(QWidget):
         ]
         for tip in tips:
             tip_label = QLabel(f"• {tip}")
-            tip_label.setStyleSheet(f"color: {Colors.TEXT}; font-size: 12px; border: none; background: transparent;")
+            tip_label.setObjectName("infoTip")
             tip_label.setWordWrap(True)
             tips_layout.addWidget(tip_label)
         
@@ -1881,17 +2621,17 @@ class InfoPage(QWidget):
         
         # Tech info
         tech_frame = QFrame()
-        tech_frame.setStyleSheet(f"background: {Colors.BG_CARD}; border: 1px solid {Colors.BORDER}; border-radius: 8px;")
+        tech_frame.setObjectName("infoCard")
         tech_layout = QVBoxLayout(tech_frame)
         tech_layout.setContentsMargins(16, 12, 16, 12)
         tech_layout.setSpacing(6)
         
         tech_title = QLabel("Technical Info")
-        tech_title.setStyleSheet(f"color: {Colors.TEXT}; font-size: 14px; font-weight: bold; border: none; background: transparent;")
+        tech_title.setObjectName("infoSectionTitle")
         tech_layout.addWidget(tech_title)
         
         tech_text = QLabel("This tool uses the Windows Restart Manager API to detect which processes are holding file locks. It provides a safe way to identify and manage locked files without restarting your computer.")
-        tech_text.setStyleSheet(f"color: {Colors.TEXT_DIM}; font-size: 12px; border: none; background: transparent;")
+        tech_text.setObjectName("infoText")
         tech_text.setWordWrap(True)
         tech_layout.addWidget(tech_text)
         
@@ -1903,13 +2643,13 @@ class InfoPage(QWidget):
     
     def _add_section(self, parent_layout, title: str, items: list):
         frame = QFrame()
-        frame.setStyleSheet(f"background: {Colors.BG_CARD}; border: 1px solid {Colors.BORDER}; border-radius: 8px;")
+        frame.setObjectName("infoCard")
         layout = QVBoxLayout(frame)
         layout.setContentsMargins(16, 12, 16, 12)
         layout.setSpacing(10)
         
         title_label = QLabel(title)
-        title_label.setStyleSheet(f"color: {Colors.TEXT}; font-size: 14px; font-weight: bold; border: none; background: transparent;")
+        title_label.setObjectName("infoSectionTitle")
         layout.addWidget(title_label)
         
         for item in items:
@@ -1935,7 +2675,7 @@ class InfoPage(QWidget):
                 label = QLabel(f'<span style="color: {Colors.ACCENT}; font-weight: bold;">{name}</span>'
                               f'<span style="color: {Colors.TEXT};"> - {desc}</span>')
             
-            label.setStyleSheet("border: none; background: transparent; font-size: 12px;")
+            label.setObjectName("infoItem")
             label.setWordWrap(True)
             row.addWidget(label)
             layout.addLayout(row)
@@ -1950,7 +2690,7 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.setWindowTitle("Unlock Inspector")
         self.setFixedSize(580, 520)
-        self.setStyleSheet(f"background-color: {Colors.BG};")
+        self.setStyleSheet(APP_QSS)
         self._setup_ui()
     
     def _toast(self, msg: str, t: str = "info"):
@@ -1960,6 +2700,11 @@ class MainWindow(QMainWindow):
         toast.show()
         toast.raise_()
     
+    def _on_tab_changed(self, index: int):
+        if self.info_page is None and self.tabs.widget(index) is self._info_tab:
+            self.info_page = InfoPage()
+            self._info_tab.layout().addWidget(self.info_page)
+    
     def _setup_ui(self):
         central = QWidget()
         self.setCentralWidget(central)
@@ -2007,8 +2752,13 @@ class MainWindow(QMainWindow):
         self.log_page = LogPage()
         self.tabs.addTab(self.log_page, "Log")
         
-        self.info_page = InfoPage()
-        self.tabs.addTab(self.info_page, "Info")
+        # Info is rarely opened - its page is built on first visit
+        self.info_page: Optional[InfoPage] = None
+        self._info_tab = QWidget()
+        info_layout = QVBoxLayout(self._info_tab)
+        info_layout.setContentsMargins(0, 0, 0, 0)
+        self.tabs.addTab(self._info_tab, "Info")
+        self.tabs.currentChanged.connect(self._on_tab_changed)
         
         self.scanner_page.log_signal = self.log_page
         
@@ -2016,7 +2766,7 @@ class MainWindow(QMainWindow):
         
         # Info footer
         footer = QLabel("by fleur  •  v1.0  •  Detects processes locking files using Windows Restart Manager API")
-        footer.setStyleSheet(f"color: {Colors.TEXT_DIM}; font-size: 10px; padding: 8px;")
+        footer.setObjectName("footer")
         footer.setAlignment(Qt.AlignCenter)
         layout.addWidget(footer)
 